@@ -9,6 +9,7 @@ Usage:
     python3 ~/.claude/orchestrator_code/conflict.py --json tasks.yaml
 """
 
+import io
 import json
 import sys
 from collections import defaultdict
@@ -33,106 +34,220 @@ def load_plan(path: str) -> dict:
         return json.loads(content)
 
 
+# Patch intent action -> builder of the resource it implicitly writes
+_IMPLIED_RESOURCE_BUILDERS = {
+    "add_router": lambda data: f"route:{data.get('prefix', '/')}",
+    "add_dependency": lambda data: f"di:{data.get('function_name', '')}",
+    "add_config": lambda data: f"config:{data.get('key', '')}",
+    "add_middleware": lambda data: f"middleware:{data.get('middleware_class', '')}",
+}
+
+
 def get_implied_resources(intent: dict) -> list:
     """Extract implied resources from patch intents."""
-    action = intent.get("action", "")
-    data = intent.get("intent", {})
+    builder = _IMPLIED_RESOURCE_BUILDERS.get(intent.get("action", ""))
+    if builder is None:
+        return []
+    return [builder(intent.get("intent", {}))]
 
-    if action == "add_router":
-        return [f"route:{data.get('prefix', '/')}"]
-    elif action == "add_dependency":
-        return [f"di:{data.get('function_name', '')}"]
-    elif action == "add_config":
-        return [f"config:{data.get('key', '')}"]
-    elif action == "add_middleware":
-        return [f"middleware:{data.get('middleware_class', '')}"]
-    return []
 
+def _task_resources(task: dict) -> dict:
+    """Resources a task writes, explicit and implied, deduplicated in order."""
+    resources = dict.fromkeys(task.get("resources_write", []))
+    for intent in task.get("patch_intents", []):
+        resources.update(dict.fromkeys(get_implied_resources(intent)))
+    return resources
 
-def detect_conflicts(tasks: list) -> list:
-    """Detect file and resource conflicts between tasks.
 
-    Checks for:
-    1. Write-write conflicts: two unordered tasks writing the same file/resource
-    2. Read-write conflicts: task reading a file while a concurrent task writes it
-    """
-    conflicts = []
-    file_writes = defaultdict(list)
-    file_reads = defaultdict(list)
-    resource_writes = defaultdict(list)
+def _compute_reachable(tasks: list) -> dict:
+    """Map each task ID to the frozenset of IDs it transitively depends on.
 
-    # Build dependency map
+    One sweep in dependency order: a task's ancestors are its direct
+    dependencies plus their already-computed ancestors, so the closure
+    costs O(V+E) set unions rather than a graph walk per task pair.
+    Tasks on (or downstream of) a dependency cycle are resolved with a
+    direct walk instead.
+    """
     task_deps = {t["id"]: set(t.get("depends_on", [])) for t in tasks}
+    dependents = defaultdict(list)
+    pending = {}
+    for tid, deps in task_deps.items():
+        known = [d for d in deps if d in task_deps]
+        pending[tid] = len(known)
+        for d in known:
+            dependents[d].append(tid)
+
+    reachable = {}
+    ready = [tid for tid, count in pending.items() if count == 0]
+    while ready:
+        tid = ready.pop()
+        closure = set(task_deps[tid])
+        for d in task_deps[tid]:
+            closure |= reachable.get(d, frozenset())
+        reachable[tid] = frozenset(closure)
+        for child in dependents[tid]:
+            pending[child] -= 1
+            if pending[child] == 0:
+                ready.append(child)
+
+    for tid in task_deps:
+        if tid not in reachable:
+            seen = set()
+            stack = list(task_deps[tid])
+            while stack:
+                dep = stack.pop()
+                if dep not in seen:
+                    seen.add(dep)
+                    stack.extend(task_deps.get(dep, ()))
+            reachable[tid] = frozenset(seen)
+    return reachable
 
-    def has_dependency_path(from_task, to_task, visited=None):
-        if visited is None:
-            visited = set()
-        if from_task in visited:
-            return False
-        visited.add(from_task)
-        if to_task in task_deps.get(from_task, set()):
-            return True
-        for dep in task_deps.get(from_task, set()):
-            if has_dependency_path(dep, to_task, visited):
-                return True
-        return False
-
-    def tasks_ordered(task_ids):
-        """Check if tasks have explicit ordering via dependencies."""
-        for i, t1 in enumerate(task_ids):
-            for t2 in task_ids[i+1:]:
-                if has_dependency_path(t1, t2) or has_dependency_path(t2, t1):
-                    return True
-        return False
 
-    # Collect writes and reads
+def _index_plan(tasks: list) -> tuple[dict, dict, dict]:
+    """Invert the plan in one sweep over tasks.
+
+    Returns:
+        tuple of (file_writes, file_reads, resource_writes), each mapping a
+        file or resource to the IDs of the tasks touching it, in plan order
+    """
+    file_writes = defaultdict(list)
+    file_reads = defaultdict(list)
+    resource_writes = defaultdict(list)
     for task in tasks:
         tid = task["id"]
         for f in task.get("files_write", []):
             file_writes[f].append(tid)
         for f in task.get("files_read", []):
             file_reads[f].append(tid)
-        for r in task.get("resources_write", []):
+        # Each task counts once per resource, even if several intents imply it
+        for r in _task_resources(task):
             resource_writes[r].append(tid)
-        for intent in task.get("patch_intents", []):
-            for r in get_implied_resources(intent):
-                resource_writes[r].append(tid)
+    return file_writes, file_reads, resource_writes
 
-    # Check write-write file conflicts
-    for file, writers in file_writes.items():
-        if len(writers) > 1 and not tasks_ordered(writers):
-            conflicts.append({"type": "file_write_write", "target": file, "tasks": writers})
 
-    # Check read-write file conflicts (concurrent tasks)
+def detect_conflicts(tasks: list, reachable: dict | None = None) -> list:
+    """Detect file and resource conflicts between tasks.
+
+    Checks for:
+    1. Write-write conflicts: two unordered tasks writing the same file/resource
+    2. Read-write conflicts: task reading a file while a concurrent task writes it
+
+    Args:
+        tasks: Task dicts from the plan
+        reachable: Precomputed _compute_reachable(tasks), to share the
+            dependency closure with other checks on the same plan
+    """
+    if reachable is None:
+        reachable = _compute_reachable(tasks)
+    no_deps = frozenset()
+
+    def ordered(t1, t2):
+        """Check if two tasks have explicit ordering via dependencies."""
+        return t2 in reachable.get(t1, no_deps) or t1 in reachable.get(t2, no_deps)
+
+    def unordered_tasks(task_ids):
+        """Tasks in task_ids that are unordered with at least one other."""
+        involved = set()
+        for i, t1 in enumerate(task_ids):
+            for t2 in task_ids[i+1:]:
+                if t1 != t2 and not ordered(t1, t2):
+                    involved.update((t1, t2))
+        return [t for t in task_ids if t in involved]
+
+    file_writes, file_reads, resource_writes = _index_plan(tasks)
+    write_write = []
+    read_write = []
+
     for file, writers in file_writes.items():
-        readers = file_reads.get(file, [])
-        for reader in readers:
+        # Write-write: any unordered pair of writers conflicts
+        if len(writers) > 1:
+            involved = unordered_tasks(writers)
+            if involved:
+                write_write.append({"type": "file_write_write", "target": file, "tasks": involved})
+
+        # Read-write: a reader concurrent with a writer of the same file
+        for reader in file_reads.get(file, ()):
             if reader in writers:
                 continue  # Same task reading and writing its own file is fine
-            # Check if the reader and any writer are concurrent (no ordering)
-            concurrent_writers = [w for w in writers if w != reader]
+            # Writers with no ordering relative to the reader are concurrent
+            concurrent_writers = [w for w in writers if not ordered(reader, w)]
             if concurrent_writers:
-                pair = [reader] + concurrent_writers
-                if not tasks_ordered(pair):
-                    conflicts.append({
-                        "type": "file_read_write",
-                        "target": file,
-                        "tasks": pair,
-                        "detail": f"{reader} reads while {concurrent_writers} write"
-                    })
+                read_write.append({
+                    "type": "file_read_write",
+                    "target": file,
+                    "tasks": [reader] + concurrent_writers,
+                    "detail": f"{reader} reads while {concurrent_writers} write"
+                })
+
+    conflicts = write_write + read_write
 
     # Check resource conflicts
     for resource, writers in resource_writes.items():
-        if len(writers) > 1 and not tasks_ordered(writers):
-            conflicts.append({"type": "resource", "target": resource, "tasks": writers})
+        if len(writers) > 1:
+            involved = unordered_tasks(writers)
+            if involved:
+                conflicts.append({"type": "resource", "target": resource, "tasks": involved})
 
     return conflicts
 
 
-def suggest_fix(conflict: dict) -> str:
-    """Suggest dependency to resolve conflict."""
+def suggest_fix(conflict: dict, reachable: dict | None = None) -> str:
+    """Suggest dependencies to resolve conflict.
+
+    Chains the involved tasks, each depending on the one before it, so a
+    conflict among N tasks is fully serialized. With the plan's reachable
+    map (see _compute_reachable) the chain follows the existing dependency
+    order, so it never suggests a cycle, and links the plan already implies
+    are left out. Without it, tasks are chained in the order listed.
+    """
     tasks = conflict["tasks"]
-    return f"Add dependency: {tasks[1]} depends_on [{tasks[0]}]"
+    if reachable is not None:
+        # An ancestor always has fewer ancestors than its descendants, so
+        # this is a topological order; ties keep their listed order
+        tasks = sorted(tasks, key=lambda t: len(reachable.get(t, ())))
+    links = "; ".join(
+        f"{later} depends_on [{earlier}]"
+        for earlier, later in zip(tasks, tasks[1:], strict=False)
+        if reachable is None or earlier not in reachable.get(later, ())
+    )
+    return f"Add dependency: {links}"
+
+
+# Summary section heading for each conflict type, in display order
+_CONFLICT_GROUPS = {
+    "file_write_write": "File Conflicts",
+    "file_read_write": "File Conflicts",
+    "resource": "Resource Conflicts",
+}
+
+
+def get_conflict_summary(conflicts: list, reachable: dict | None = None) -> str:
+    """Render conflicts as a human-readable report, grouped by kind.
+
+    Args:
+        conflicts: Conflicts from detect_conflicts
+        reachable: The plan's _compute_reachable map, passed to suggest_fix
+
+    Returns:
+        Multi-line report with a fix suggestion per conflict
+    """
+    if not conflicts:
+        return "✓ No conflicts detected"
+
+    groups = {}
+    for c in conflicts:
+        heading = _CONFLICT_GROUPS.get(c["type"], "Other Conflicts")
+        groups.setdefault(heading, []).append(c)
+
+    buf = io.StringIO()
+    buf.write(f"⚠ Found {len(conflicts)} conflict(s):\n")
+    for heading, items in groups.items():
+        buf.write(f"\n{heading}:\n")
+        for c in items:
+            buf.write(f"\n  [{c['type'].upper()}] {c['target']}\n")
+            buf.write(f"    Tasks: {', '.join(c['tasks'])}\n")
+            buf.write(f"    Fix: {suggest_fix(c, reachable)}\n")
+    return buf.getvalue()
 
 
 def main():
@@ -143,21 +258,17 @@ def main():
     args = parser.parse_args()
 
     plan = load_plan(args.plan_file)
-    conflicts = detect_conflicts(plan.get("tasks", []))
+    tasks = plan.get("tasks", [])
+    reachable = _compute_reachable(tasks)
+    conflicts = detect_conflicts(tasks, reachable)
 
     if args.json:
         print(json.dumps({"conflicts": conflicts, "count": len(conflicts)}, indent=2))
         sys.exit(1 if conflicts else 0)
 
+    print(f"\n{get_conflict_summary(conflicts, reachable)}")
     if conflicts:
-        print(f"\n⚠ Found {len(conflicts)} conflict(s):\n")
-        for c in conflicts:
-            print(f"  [{c['type'].upper()}] {c['target']}")
-            print(f"    Tasks: {', '.join(c['tasks'])}")
-            print(f"    Fix: {suggest_fix(c)}\n")
         sys.exit(1)
-    else:
-        print("\n✓ No conflicts detected")
 
 
 if __name__ == "__main__":
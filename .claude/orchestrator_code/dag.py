@@ -11,7 +11,8 @@ Usage:
 
 import json
 import sys
-from collections import defaultdict
+from array import array
+from collections import defaultdict, deque
 from pathlib import Path
 
 try:
@@ -36,15 +37,41 @@ def load_plan(path: str) -> dict:
         return json.loads(content)
 
 
-def validate_dependency_ids(tasks: list) -> list[str]:
+def build_graph(tasks: list) -> dict:
+    """Index the dependency graph of a plan in one pass over its tasks.
+
+    Returns:
+        dict with "ids" (set of task IDs), "deps" (task ID -> depends_on
+        list) and "dependents" (task ID -> IDs of tasks depending on it,
+        one entry per reference to a known task)
+    """
+    ids = {t["id"] for t in tasks}
+    deps = {}
+    dependents = defaultdict(list)
+    for task in tasks:
+        tid = task["id"]
+        deps[tid] = task.get("depends_on", [])
+        for dep in deps[tid]:
+            if dep in ids:
+                dependents[dep].append(tid)
+    return {"ids": ids, "deps": deps, "dependents": dependents}
+
+
+def validate_dependency_ids(tasks: list, graph: dict | None = None) -> list[str]:
     """Validate that all dependency IDs reference existing tasks.
 
+    Args:
+        tasks: Task dicts from the plan
+        graph: Precomputed build_graph(tasks), to share with other checks
+
     Returns list of error messages (empty if valid).
     """
-    task_ids = {t["id"] for t in tasks}
+    if graph is None:
+        graph = build_graph(tasks)
+    task_ids = graph["ids"]
     errors = []
     for task in tasks:
-        for dep in task.get("depends_on", []):
+        for dep in graph["deps"][task["id"]]:
             if dep not in task_ids:
                 errors.append(
                     f"Task '{task['id']}' depends on '{dep}' which does not exist. "
@@ -53,60 +80,129 @@ def validate_dependency_ids(tasks: list) -> list[str]:
     return errors
 
 
-def detect_cycles(tasks: list) -> list | None:
-    """Detect circular dependencies in task DAG. Returns cycle path or None."""
-    graph = defaultdict(list)
-    for task in tasks:
-        tid = task["id"]
-        for dep in task.get("depends_on", []):
-            graph[dep].append(tid)
-
-    WHITE, GRAY, BLACK = 0, 1, 2
-    color = {t["id"]: WHITE for t in tasks}
-
-    def dfs(node, path):
-        color[node] = GRAY
-        path.append(node)
-        for neighbor in graph[node]:
-            if color.get(neighbor, WHITE) == GRAY:
-                cycle_start = path.index(neighbor)
-                return path[cycle_start:] + [neighbor]
-            if color.get(neighbor, WHITE) == WHITE:
-                result = dfs(neighbor, path)
-                if result:
-                    return result
-        path.pop()
-        color[node] = BLACK
+def detect_cycles(tasks: list, graph: dict | None = None) -> list | None:
+    """Detect circular dependencies in task DAG. Returns cycle path or None.
+
+    Iterative Kahn's algorithm: tasks are peeled off as their dependencies
+    are satisfied; whatever remains is on or behind a cycle. A cycle path
+    (each task depending on the one before it, first == last) is then
+    recovered by following unpeeled dependencies from a remaining task.
+    """
+    if graph is None:
+        graph = build_graph(tasks)
+    deps = graph["deps"]
+    dependents = graph["dependents"]
+    in_degree = {
+        tid: sum(dep in graph["ids"] for dep in tid_deps)
+        for tid, tid_deps in deps.items()
+    }
+
+    ready = deque(tid for tid, degree in in_degree.items() if degree == 0)
+    while ready:
+        for child in dependents[ready.popleft()]:
+            in_degree[child] -= 1
+            if in_degree[child] == 0:
+                ready.append(child)
+
+    residual = {tid for tid, degree in in_degree.items() if degree > 0}
+    if not residual:
         return None
 
-    for task in tasks:
-        if color[task["id"]] == WHITE:
-            cycle = dfs(task["id"], [])
-            if cycle:
-                return cycle
-    return None
+    # Every remaining task has an unpeeled dependency, so walking backwards
+    # through them must revisit a task; the walk from there is the cycle.
+    node = next(t["id"] for t in tasks if t["id"] in residual)
+    walk = []
+    position = {}
+    while node not in position:
+        position[node] = len(walk)
+        walk.append(node)
+        node = next(d for d in deps[node] if d in residual)
+    cycle = walk[position[node]:][::-1]
+    return cycle + [cycle[0]]
 
 
-def topological_sort(tasks: list) -> list | None:
-    """Return tasks in execution order (parallel waves). None if cycle detected."""
-    in_degree = {t["id"]: len(t.get("depends_on", [])) for t in tasks}
-    waves = []
-    remaining = set(t["id"] for t in tasks)
+def _intern_tasks(graph: dict) -> tuple[list[str], list[list[int]], array]:
+    """Renumber the graph with int indices for the sort kernel.
 
-    while remaining:
-        wave = [tid for tid in remaining if in_degree[tid] == 0]
-        if not wave:
-            return None  # Cycle detected
+    Returns:
+        tuple of (id_by_index, dependents_by_index, in_degree). In-degree
+        counts every depends_on entry, so a task with a missing dependency
+        never becomes ready.
+    """
+    id_by_index = list(graph["deps"])
+    index_of = {tid: i for i, tid in enumerate(id_by_index)}
+    dependents_by_index = [
+        [index_of[child] for child in graph["dependents"].get(tid, ())]
+        for tid in id_by_index
+    ]
+    in_degree = array("i", (len(graph["deps"][tid]) for tid in id_by_index))
+    return id_by_index, dependents_by_index, in_degree
+
+
+def _kahn_with_depth(graph: dict) -> tuple[list | None, list | None]:
+    """Sort the graph into waves and find its critical path in one sweep.
+
+    Level-by-level Kahn's algorithm: a task's wave is its depth, one more
+    than its deepest dependency, and the dependency that set that depth is
+    kept as a back-pointer so the longest chain can be rebuilt afterwards.
+
+    Returns:
+        tuple of (waves, critical_path), or (None, None) if a cycle or a
+        missing dependency leaves some task unscheduled
+    """
+    id_by_index, dependents_by_index, in_degree = _intern_tasks(graph)
+    depth = array("i", [0]) * len(id_by_index)
+    pred = [-1] * len(id_by_index)
+
+    waves = []
+    wave = [i for i, degree in enumerate(in_degree) if degree == 0]
+    placed = 0
+    while wave:
         waves.append(wave)
-        for tid in wave:
-            remaining.remove(tid)
-            for t in tasks:
-                if tid in t.get("depends_on", []):
-                    in_degree[t["id"]] -= 1
+        placed += len(wave)
+        next_wave = []
+        for i in wave:
+            for child in dependents_by_index[i]:
+                if depth[i] + 1 > depth[child]:
+                    depth[child] = depth[i] + 1
+                    pred[child] = i
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    next_wave.append(child)
+        wave = sorted(next_wave)
+
+    if placed < len(id_by_index):
+        return None, None  # Cycle detected
 
+    critical_path = []
+    node = waves[-1][0] if waves else -1
+    while node != -1:
+        critical_path.append(id_by_index[node])
+        node = pred[node]
+    critical_path.reverse()
+
+    return [[id_by_index[i] for i in w] for w in waves], critical_path
+
+
+def topological_sort(tasks: list, graph: dict | None = None) -> list | None:
+    """Return tasks in execution order (parallel waves). None if cycle detected.
+
+    Tasks within a wave are listed in plan order.
+    """
+    if graph is None:
+        graph = build_graph(tasks)
+    waves, _ = _kahn_with_depth(graph)
     return waves
 
 
+def compute_critical_path(tasks: list, graph: dict | None = None) -> list | None:
+    """Return the longest dependency chain, first task first. None if cycle detected."""
+    if graph is None:
+        graph = build_graph(tasks)
+    _, critical_path = _kahn_with_depth(graph)
+    return critical_path
+
+
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Validate DAG and compute execution waves")
@@ -116,9 +212,10 @@ def main():
 
     plan = load_plan(args.plan_file)
     tasks = plan.get("tasks", [])
+    graph = build_graph(tasks)
 
     # Validate dependency IDs exist before cycle detection
-    dep_errors = validate_dependency_ids(tasks)
+    dep_errors = validate_dependency_ids(tasks, graph)
     if dep_errors:
         if args.json:
             print(json.dumps({"valid": False, "errors": dep_errors}, indent=2))
@@ -128,7 +225,7 @@ def main():
                 print(f"  - {err}")
         sys.exit(1)
 
-    cycle = detect_cycles(tasks)
+    cycle = detect_cycles(tasks, graph)
 
     if cycle:
         if args.json:
@@ -137,20 +234,23 @@ def main():
             print(f"\n✗ Circular dependency detected: {' → '.join(cycle)}")
         sys.exit(1)
 
-    waves = topological_sort(tasks)
+    waves, critical_path = _kahn_with_depth(graph)
 
     if args.json:
         print(json.dumps({
             "valid": True,
             "waves": waves,
             "total_waves": len(waves),
-            "total_tasks": len(tasks)
+            "total_tasks": len(tasks),
+            "critical_path": critical_path
         }, indent=2))
     else:
         print("\n✓ DAG is valid")
         print(f"\nExecution waves ({len(waves)} waves):")
         for i, wave in enumerate(waves):
             print(f"  Wave {i+1}: {', '.join(wave)}")
+        if critical_path:
+            print(f"\nCritical path: {' → '.join(critical_path)}")
 
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ Usage:
 
 import hashlib
 import json
+import os
 import sys
 from pathlib import Path
 
@@ -29,6 +30,23 @@ LOCKFILES = [
     "composer.lock",
 ]
 
+_LOCKFILE_NAMES = frozenset(LOCKFILES)
+
+
+def _present_lockfiles(base_path: Path) -> set[str]:
+    """Return the LOCKFILES names present in base_path.
+
+    Uses one directory scan instead of a stat() per candidate lockfile.
+    """
+    try:
+        with os.scandir(base_path) as entries:
+            return {
+                entry.name for entry in entries
+                if entry.name in _LOCKFILE_NAMES and entry.is_file()
+            }
+    except OSError:
+        return set()
+
 
 def compute_env_hash(base_path: Path = None) -> tuple[str, list[str]]:
     """Compute environment hash from ALL present lockfiles.
@@ -43,11 +61,7 @@ def compute_env_hash(base_path: Path = None) -> tuple[str, list[str]]:
         base_path = Path.cwd()
 
     # Find ALL present lockfiles
-    found_lockfiles = []
-    for lockfile in LOCKFILES:
-        path = base_path / lockfile
-        if path.exists():
-            found_lockfiles.append(lockfile)
+    found_lockfiles = list(_present_lockfiles(base_path))
 
     if not found_lockfiles:
         return "no-lock", []
@@ -76,10 +90,10 @@ def compute_env_hash_legacy(base_path: Path = None) -> tuple[str, str | None]:
     if base_path is None:
         base_path = Path.cwd()
 
+    present = _present_lockfiles(base_path)
     for lockfile in LOCKFILES:
-        path = base_path / lockfile
-        if path.exists():
-            content = path.read_bytes()
+        if lockfile in present:
+            content = (base_path / lockfile).read_bytes()
             return hashlib.sha256(content).hexdigest()[:16], lockfile
 
     return "no-lock", None
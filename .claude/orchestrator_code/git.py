@@ -3,9 +3,14 @@
 
 Standalone version for .claude/orchestrator_code with no internal package imports.
 
+Read-only queries are passed as argument lists so git is exec'd directly
+instead of through /bin/sh. Queries that compare against the working tree
+use --no-optional-locks: git skips its opportunistic index refresh, so a
+status probe never takes index.lock away from a worker that is committing.
+
 Usage:
     python3 ~/.claude/orchestrator_code/git.py modified <worktree_path>
-    python3 ~/.claude/orchestrator_code/git.py diff-stats <worktree_path> <file>
+    python3 ~/.claude/orchestrator_code/git.py diff-stats <worktree_path> [<file>]
 """
 
 from __future__ import annotations
@@ -16,7 +21,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of a shell command execution."""
 
@@ -26,7 +31,7 @@ class CommandResult:
     duration_ms: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDiffStats:
     """Statistics for a file diff."""
 
@@ -59,6 +64,7 @@ def run_command(
     command: str | list[str],
     cwd: str | Path | None = None,
     timeout: int = 60,
+    env: dict[str, str] | None = None,
 ) -> CommandResult:
     """Run a command and return the result.
 
@@ -66,6 +72,7 @@ def run_command(
         command: Command as argument list (preferred) or shell string (legacy)
         cwd: Working directory for the command
         timeout: Timeout in seconds
+        env: Environment for the command (defaults to the current environment)
 
     Returns:
         CommandResult with returncode, stdout, stderr
@@ -81,6 +88,7 @@ def run_command(
             capture_output=True,
             text=True,
             timeout=timeout,
+            env=env,
         )
         duration_ms = int((time.time() - start) * 1000)
 
@@ -117,7 +125,7 @@ def get_repo_root(path: str | Path | None = None) -> Path | None:
     Returns:
         Path to repository root, or None if not in a repo
     """
-    result = run_command("git rev-parse --show-toplevel", cwd=path)
+    result = run_command(["git", "rev-parse", "--show-toplevel"], cwd=path)
     if result.returncode == 0:
         return Path(result.stdout.strip())
     return None
@@ -132,7 +140,7 @@ def get_current_branch(cwd: str | Path | None = None) -> str | None:
     Returns:
         Branch name, or None if detached or not in a repo
     """
-    result = run_command("git rev-parse --abbrev-ref HEAD", cwd=cwd)
+    result = run_command(["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=cwd)
     if result.returncode == 0:
         branch = result.stdout.strip()
         return None if branch == "HEAD" else branch
@@ -148,7 +156,7 @@ def get_current_commit(cwd: str | Path | None = None) -> str | None:
     Returns:
         Full commit hash, or None if not in a repo
     """
-    result = run_command("git rev-parse HEAD", cwd=cwd)
+    result = run_command(["git", "rev-parse", "HEAD"], cwd=cwd)
     if result.returncode == 0:
         return result.stdout.strip()
     return None
@@ -163,7 +171,7 @@ def get_short_commit(cwd: str | Path | None = None) -> str | None:
     Returns:
         Short commit hash, or None if not in a repo
     """
-    result = run_command("git rev-parse --short HEAD", cwd=cwd)
+    result = run_command(["git", "rev-parse", "--short", "HEAD"], cwd=cwd)
     if result.returncode == 0:
         return result.stdout.strip()
     return None
@@ -189,7 +197,7 @@ def get_modified_files(worktree: str | Path, base: str = "main") -> set[str]:
     if result.returncode != 0:
         # Fall back to comparing working tree
         result = run_command(
-            ["git", "diff", "--name-only", base],
+            ["git", "--no-optional-locks", "diff", "--name-only", base],
             cwd=worktree,
         )
 
@@ -208,7 +216,7 @@ def get_staged_files(cwd: str | Path | None = None) -> set[str]:
     Returns:
         Set of staged file paths
     """
-    result = run_command("git diff --cached --name-only", cwd=cwd)
+    result = run_command(["git", "--no-optional-locks", "diff", "--cached", "--name-only"], cwd=cwd)
     if result.returncode == 0:
         return {f.strip() for f in result.stdout.strip().split("\n") if f.strip()}
     return set()
@@ -223,15 +231,34 @@ def get_unstaged_files(cwd: str | Path | None = None) -> set[str]:
     Returns:
         Set of file paths with unstaged changes
     """
-    result = run_command("git diff --name-only", cwd=cwd)
+    result = run_command(["git", "--no-optional-locks", "diff", "--name-only"], cwd=cwd)
     if result.returncode == 0:
         return {f.strip() for f in result.stdout.strip().split("\n") if f.strip()}
     return set()
 
 
+def _parse_numstat_counts(added: str, removed: str) -> FileDiffStats | None:
+    """Convert one ``git diff --numstat`` count pair into FileDiffStats.
+
+    Binary files report ``-`` for both counts and are treated as zero lines.
+    """
+    try:
+        lines_added = int(added) if added != "-" else 0
+        lines_removed = int(removed) if removed != "-" else 0
+    except ValueError:
+        return None
+    return FileDiffStats(
+        lines_added=lines_added,
+        lines_removed=lines_removed,
+        lines_changed=lines_added + lines_removed,
+    )
+
+
 def get_file_diff_stats(worktree: str | Path, file_path: str) -> FileDiffStats:
     """Get diff statistics for a specific file.
 
+    Prefer get_all_diff_stats() when stats are needed for several files.
+
     Args:
         worktree: Path to the worktree
         file_path: Path to the file (relative to worktree)
@@ -240,27 +267,55 @@ def get_file_diff_stats(worktree: str | Path, file_path: str) -> FileDiffStats:
         FileDiffStats with lines added, removed, and total changed
     """
     result = run_command(
-        ["git", "diff", "--numstat", "main", "--", file_path],
+        ["git", "--no-optional-locks", "diff", "--numstat", "main", "--", file_path],
         cwd=worktree,
     )
 
     if result.returncode == 0 and result.stdout.strip():
         parts = result.stdout.strip().split()
         if len(parts) >= 2:
-            try:
-                added = int(parts[0]) if parts[0] != "-" else 0
-                removed = int(parts[1]) if parts[1] != "-" else 0
-                return FileDiffStats(
-                    lines_added=added,
-                    lines_removed=removed,
-                    lines_changed=added + removed,
-                )
-            except ValueError:
-                pass
+            stats = _parse_numstat_counts(parts[0], parts[1])
+            if stats is not None:
+                return stats
 
     return FileDiffStats(lines_added=0, lines_removed=0, lines_changed=0)
 
 
+def get_all_diff_stats(worktree: str | Path, base: str = "main") -> dict[str, FileDiffStats]:
+    """Get diff statistics for every file changed in a worktree.
+
+    Runs a single ``git diff --numstat`` instead of one git process per file.
+
+    Args:
+        worktree: Path to the worktree
+        base: Base branch to compare against
+
+    Returns:
+        Dict mapping file path (relative to worktree) to FileDiffStats
+    """
+    validate_ref_name(base)
+    # --no-renames keeps one record per path instead of "old => new" entries;
+    # -z leaves unusual paths unquoted
+    result = run_command(
+        ["git", "--no-optional-locks", "diff", "--numstat", "--no-renames", "-z", base],
+        cwd=worktree,
+    )
+
+    stats: dict[str, FileDiffStats] = {}
+    if result.returncode != 0:
+        return stats
+
+    for record in result.stdout.split("\0"):
+        parts = record.split("\t", 2)
+        if len(parts) != 3:
+            continue
+        file_stats = _parse_numstat_counts(parts[0], parts[1])
+        if file_stats is not None:
+            stats[parts[2]] = file_stats
+
+    return stats
+
+
 def commit_changes(
     cwd: str | Path,
     message: str,
@@ -419,9 +474,10 @@ def main():
     mod_parser.add_argument("--base", default="main", help="Base branch")
     
     # diff-stats command
-    diff_parser = subparsers.add_parser("diff-stats", help="Get diff stats for a file")
+    diff_parser = subparsers.add_parser("diff-stats", help="Get diff stats for a file (or all files)")
     diff_parser.add_argument("worktree", help="Path to worktree")
-    diff_parser.add_argument("file", help="File to get stats for")
+    diff_parser.add_argument("file", nargs="?", help="File to get stats for (default: all changed files)")
+    diff_parser.add_argument("--base", default="main", help="Base branch")
     
     # repo-root command
     subparsers.add_parser("repo-root", help="Get repository root")
@@ -433,12 +489,23 @@ def main():
         print(json.dumps(list(files), indent=2))
         
     elif args.command == "diff-stats":
-        stats = get_file_diff_stats(args.worktree, args.file)
-        print(json.dumps({
-            "lines_added": stats.lines_added,
-            "lines_removed": stats.lines_removed,
-            "lines_changed": stats.lines_changed
-        }, indent=2))
+        if args.file is None:
+            all_stats = get_all_diff_stats(args.worktree, args.base)
+            print(json.dumps({
+                path: {
+                    "lines_added": stats.lines_added,
+                    "lines_removed": stats.lines_removed,
+                    "lines_changed": stats.lines_changed
+                }
+                for path, stats in all_stats.items()
+            }, indent=2))
+        else:
+            stats = get_file_diff_stats(args.worktree, args.file)
+            print(json.dumps({
+                "lines_added": stats.lines_added,
+                "lines_removed": stats.lines_removed,
+                "lines_changed": stats.lines_changed
+            }, indent=2))
         
     elif args.command == "repo-root":
         root = get_repo_root()
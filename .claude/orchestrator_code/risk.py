@@ -6,6 +6,7 @@ Usage:
     python3 ~/.claude/orchestrator_code/risk.py tasks.yaml
     python3 ~/.claude/orchestrator_code/risk.py --json tasks.yaml
     python3 ~/.claude/orchestrator_code/risk.py --config .claude-agents.yaml tasks.yaml
+    python3 ~/.claude/orchestrator_code/risk.py --fast tasks.yaml     # approval gating only
 
 Sensitive patterns can be customized via .claude-agents.yaml:
 
@@ -18,9 +19,11 @@ Sensitive patterns can be customized via .claude-agents.yaml:
       auto_approve_threshold: 25
 """
 
+import functools
 import json
 import re
 import sys
+import threading
 from pathlib import Path
 
 try:
@@ -120,12 +123,69 @@ def load_config(config_path: str | None) -> dict:
     return config
 
 
-def compute_risk_score(plan: dict, config: dict | None = None) -> dict:
+@functools.lru_cache(maxsize=8)
+def _compile_sensitive_patterns(sensitive_patterns: tuple) -> list:
+    """Compile (pattern, weight) pairs, skipping invalid or ReDoS-prone patterns.
+
+    Cached per pattern table so repeated scoring with the same config does
+    not re-validate and recompile every pattern.
+
+    Returns:
+        list of (compiled_pattern, weight, raw_pattern) tuples
+    """
+    compiled_patterns = []
+    for pattern, weight in sensitive_patterns:
+        # Reject patterns with nested quantifiers (ReDoS risk)
+        if re.search(r'(\+|\*|\{)\s*(\+|\*|\{)', pattern):
+            print(f"Warning: Rejecting risk pattern '{pattern}': nested quantifiers (ReDoS risk)", file=sys.stderr)
+            continue
+        try:
+            compiled_patterns.append((re.compile(pattern, re.IGNORECASE), weight, pattern))
+        except re.error as e:
+            print(f"Warning: Invalid risk pattern '{pattern}': {e}", file=sys.stderr)
+    return compiled_patterns
+
+
+def _match_sensitive_pattern(path: str, compiled_patterns: list) -> int | None:
+    """Index into compiled_patterns of the first pattern found in path, or None."""
+    for i, (compiled, _, _) in enumerate(compiled_patterns):
+        if compiled.search(path):
+            return i
+    return None
+
+
+def _risk_result(score: int, factors: list, auto_approve_threshold: int) -> dict:
+    """Assemble the compute_risk_score result for a final score."""
+    auto_approve = score <= auto_approve_threshold
+    status = "AUTO-APPROVE" if auto_approve else ("REQUIRES REVIEW" if score <= auto_approve_threshold * 2 else "HIGH RISK")
+
+    return {
+        "score": score,
+        "factors": factors,
+        # Factor kinds present, so callers can test membership without
+        # substring-scanning the "category:detail" factor strings
+        "factor_categories": sorted({f.split(":", 1)[0] for f in factors}),
+        "auto_approve": auto_approve,
+        "auto_approve_threshold": auto_approve_threshold,
+        "status": status
+    }
+
+
+def compute_risk_score(plan: dict, config: dict | None = None, fast: bool = False) -> dict:
     """Compute risk score for an execution plan.
 
     Args:
         plan: The execution plan (tasks.yaml content)
         config: Optional config dict from load_config(). If None, uses defaults.
+        fast: Stop as soon as the score exceeds the auto-approve threshold.
+            auto_approve is still exact, but score and factors are then a
+            partial lower bound. Ignored when a sensitive pattern has a
+            negative weight, since the score could still drop below it.
+            Meant for approval gating; reports should use the default.
+
+    Returns:
+        dict with score, factors ("category:detail" strings),
+        factor_categories, auto_approve, auto_approve_threshold and status
     """
     if config is None:
         config = {
@@ -139,97 +199,123 @@ def compute_risk_score(plan: dict, config: dict | None = None) -> dict:
     score = 0
     factors = []
     tasks = plan.get("tasks", [])
+    num_tasks = len(tasks)
+    num_contracts = len(plan.get("contracts", []))
 
     # Pre-compile regex patterns with validation and ReDoS protection
-    compiled_patterns = []
-    for pattern, weight in sensitive_patterns:
-        # Reject patterns with nested quantifiers (ReDoS risk)
-        if re.search(r'(\+|\*|\{)\s*(\+|\*|\{)', pattern):
-            print(f"Warning: Rejecting risk pattern '{pattern}': nested quantifiers (ReDoS risk)", file=sys.stderr)
-            continue
-        try:
-            compiled_patterns.append((re.compile(pattern, re.IGNORECASE), weight, pattern))
-        except re.error as e:
-            print(f"Warning: Invalid risk pattern '{pattern}': {e}", file=sys.stderr)
+    pattern_table = tuple((pattern, weight) for pattern, weight in sensitive_patterns)
+    compiled_patterns = _compile_sensitive_patterns(pattern_table)
+
+    # An early exit is only exact while every factor adds to the score, and
+    # load_config accepts negative pattern weights, which can lower it
+    if any(weight < 0 for _, weight, _ in compiled_patterns):
+        fast = False
+
+    # The O(1) plan-size factors (2 and 6). Fast mode counts them before any
+    # path is matched, so a plan over the threshold on size alone exits
+    # early; they are still reported in their usual place below
+    size_factors = []
+    if num_tasks > 5:
+        size_factors.append(((num_tasks - 5) * 5, f"many_tasks:{num_tasks}"))
+    if num_contracts > 3:
+        size_factors.append(((num_contracts - 3) * 5, f"many_contracts:{num_contracts}"))
+    size_score = sum(points for points, _ in size_factors)
 
-    # Factor 1: Sensitive paths (with per-match timeout protection)
+    def _early_result():
+        return _risk_result(
+            score + size_score,
+            factors + [factor for _, factor in size_factors],
+            auto_approve_threshold,
+        )
+
+    if fast and size_score > auto_approve_threshold:
+        return _early_result()
+
+    # Factor 1: Sensitive paths (with per-path timeout protection)
     import signal
 
     def _timeout_handler(signum, frame):
         raise TimeoutError("Regex match timed out")
 
-    for task in tasks:
-        for path in task.get("files_write", []):
-            for compiled, weight, raw_pattern in compiled_patterns:
-                try:
-                    # Set 1-second alarm for regex matching (Unix only)
+    # Per-task counts for the scale and coverage factors, gathered in the
+    # same sweep over tasks as the path matching
+    num_files = 0
+    hot_file_count = 0
+    new_deps = 0
+    tasks_with_tests = 0
+
+    # Each path gets its own 1-second alarm. SIGALRM is Unix-only and its
+    # handler can only be set from the main thread, so elsewhere paths are
+    # matched without a timeout. The handler is installed on the first path
+    use_alarm = hasattr(signal, "SIGALRM") and threading.current_thread() is threading.main_thread()
+    alarm_installed = False
+    old_handler = None
+    try:
+        for task in tasks:
+            files_write = task.get("files_write", [])
+            num_files += len(files_write)
+            hot_file_count += len(task.get("patch_intents", []))
+            new_deps += len(task.get("deps_required", {}).get("runtime", []))
+            if any(v.get("type") == "test" for v in task.get("verification", [])):
+                tasks_with_tests += 1
+
+            for path in files_write:
+                if use_alarm and not alarm_installed:
                     old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-                    signal.alarm(1)
-                    match = compiled.search(path)
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
-                    if match:
-                        score += weight
-                        factors.append(f"sensitive_path:{path}:{raw_pattern.split('|')[0]}")
-                        break
+                    alarm_installed = True
+                try:
+                    if alarm_installed:
+                        signal.alarm(1)
+                    matched = _match_sensitive_pattern(path, compiled_patterns)
+                    if alarm_installed:
+                        signal.alarm(0)
                 except TimeoutError:
                     signal.alarm(0)
-                    print(f"Warning: Regex timeout on pattern '{raw_pattern}' against '{path}'", file=sys.stderr)
-                    break
+                    print(f"Warning: Regex timeout matching sensitive patterns against '{path}'", file=sys.stderr)
+                    continue
+                if matched is not None:
+                    _, weight, raw_pattern = compiled_patterns[matched]
+                    score += weight
+                    factors.append(f"sensitive_path:{path}:{raw_pattern.split('|')[0]}")
+                    if fast and score + size_score > auto_approve_threshold:
+                        return _early_result()
+    finally:
+        if alarm_installed:
+            signal.alarm(0)
+            signal.signal(signal.SIGALRM, old_handler)
 
     # Factor 2: Scale - tasks
-    num_tasks = len(tasks)
     if num_tasks > 5:
         score += (num_tasks - 5) * 5
         factors.append(f"many_tasks:{num_tasks}")
 
     # Factor 3: Scale - files
-    num_files = sum(len(t.get("files_write", [])) for t in tasks)
     if num_files > 10:
         score += (num_files - 10) * 3
         factors.append(f"many_files:{num_files}")
 
     # Factor 4: Hot files (patch intents)
-    hot_file_count = sum(len(t.get("patch_intents", [])) for t in tasks)
     if hot_file_count > 3:
         score += (hot_file_count - 3) * 5
         factors.append(f"many_hot_files:{hot_file_count}")
 
     # Factor 5: New dependencies
-    new_deps = sum(
-        len(t.get("deps_required", {}).get("runtime", []))
-        for t in tasks
-    )
     if new_deps > 0:
         score += new_deps * 3
         factors.append(f"new_dependencies:{new_deps}")
 
     # Factor 6: Contracts
-    num_contracts = len(plan.get("contracts", []))
     if num_contracts > 3:
         score += (num_contracts - 3) * 5
         factors.append(f"many_contracts:{num_contracts}")
 
     # Factor 7: Test coverage
-    tasks_with_tests = sum(
-        1 for t in tasks
-        if any(v.get("type") == "test" for v in t.get("verification", []))
-    )
     if tasks and tasks_with_tests < len(tasks):
         coverage = tasks_with_tests / len(tasks)
         score += int((1.0 - coverage) * 20)
         factors.append(f"incomplete_test_coverage:{coverage:.0%}")
 
-    auto_approve = score <= auto_approve_threshold
-    status = "AUTO-APPROVE" if auto_approve else ("REQUIRES REVIEW" if score <= auto_approve_threshold * 2 else "HIGH RISK")
-
-    return {
-        "score": score,
-        "factors": factors,
-        "auto_approve": auto_approve,
-        "auto_approve_threshold": auto_approve_threshold,
-        "status": status
-    }
+    return _risk_result(score, factors, auto_approve_threshold)
 
 
 def main():
@@ -238,11 +324,14 @@ def main():
     parser.add_argument("plan_file", help="Path to tasks.yaml or tasks.json")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
     parser.add_argument("--config", help="Path to .claude-agents.yaml config file")
+    parser.add_argument("--fast", action="store_true",
+                        help="Stop once the plan exceeds the auto-approve threshold "
+                             "(exact approval decision, partial score and factors)")
     args = parser.parse_args()
 
     config = load_config(args.config)
     plan = load_plan(args.plan_file)
-    result = compute_risk_score(plan, config)
+    result = compute_risk_score(plan, config, fast=args.fast)
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -10,11 +10,22 @@ Usage:
     python3 ~/.claude/orchestrator_code/verify.py full task-a tasks.yaml
 """
 
+import contextlib
 import fnmatch
+import functools
+import hashlib
 import json
+import os
+import re
 import shlex
+import signal
 import subprocess
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 try:
@@ -32,9 +43,123 @@ FORBIDDEN_PATTERNS = [
     "*.lock",  # lockfiles should only be modified by supervisor
 ]
 
+# Only the tail of each verification command's stdout/stderr is kept
+MAX_OUTPUT_BYTES = 1000
+
+# How often a running command checks whether it has been cancelled
+CANCEL_POLL_SECONDS = 0.1
+
+# Passed verification results, keyed by command + worktree content + env hash
+VERIFICATION_CACHE_FILE = Path(".orchestrator/cache/verification.json")
+MAX_CACHE_ENTRIES = 512
+
+
+_WILDCARDS = frozenset("*?[")
+
+
+def _compile_forbidden(patterns: list[str], indices: list[int]) -> re.Pattern | None:
+    """Combine forbidden patterns into a single regex, one named group each.
+
+    Directory patterns (trailing "/") match at the start of the path or after
+    any "/"; other patterns are fnmatch globs. Groups are named after the
+    pattern's index in `patterns`. Use with re.match() against both the full
+    path and its basename.
+    """
+    alternatives = []
+    for i in indices:
+        pattern = patterns[i]
+        if pattern.endswith("/"):
+            body = r"(?s:.*/)?" + re.escape(pattern)
+        else:
+            body = fnmatch.translate(pattern)
+        alternatives.append(f"(?P<g{i}>{body})")
+    return re.compile("|".join(alternatives)) if alternatives else None
+
+
+def _index_forbidden(patterns: list[str]) -> tuple[dict, dict, list, re.Pattern | None]:
+    """Split forbidden patterns by shape so most need no regex at all.
+
+    Returns (dirs, names, suffixes, fallback):
+        dirs: "name/" patterns, keyed by directory component
+        names: wildcard-free patterns, keyed by basename
+        suffixes: (suffix, index) for "*suffix" globs, in pattern order
+        fallback: combined regex for anything else (or None)
+    dirs and names map to the pattern's index, which gives its priority.
+    """
+    dirs, names, suffixes, rest = {}, {}, [], []
+    for i, pattern in enumerate(patterns):
+        body = pattern[:-1] if pattern.endswith("/") else pattern
+        if "/" in body or _WILDCARDS.intersection(body.lstrip("*")):
+            rest.append(i)
+        elif pattern.endswith("/"):
+            if body.startswith("*"):
+                rest.append(i)
+            else:
+                dirs.setdefault(body, i)
+        elif body.startswith("*"):
+            suffixes.append((body.lstrip("*"), i))
+        else:
+            names.setdefault(body, i)
+    return dirs, names, suffixes, _compile_forbidden(patterns, rest)
+
+
+_FORBIDDEN_DIRS, _FORBIDDEN_NAMES, _FORBIDDEN_SUFFIXES, _FORBIDDEN_RE = (
+    _index_forbidden(FORBIDDEN_PATTERNS)
+)
+
+
+def check_forbidden_patterns(file_path: str) -> str | None:
+    """Return the forbidden pattern matching file_path, or None if allowed.
+
+    Patterns are tried against the full path first, then the basename; the
+    earliest pattern in FORBIDDEN_PATTERNS wins. Directory, exact-name and
+    "*suffix" patterns are resolved with dict lookups and str.endswith, in
+    one pass over the path's components; only other globs use a regex.
+    """
+    parents = file_path.split("/")
+    basename = parents.pop()
+
+    hits = [_FORBIDDEN_DIRS[c] for c in parents if c in _FORBIDDEN_DIRS]
+    for suffix, i in _FORBIDDEN_SUFFIXES:
+        if basename.endswith(suffix):
+            hits.append(i)
+            break
+    name_hit = _FORBIDDEN_NAMES.get(basename)
+    if name_hit is not None and not parents:
+        hits.append(name_hit)
+    if _FORBIDDEN_RE is not None:
+        m = _FORBIDDEN_RE.match(file_path)
+        if m is not None:
+            hits.append(int(m.lastgroup[1:]))
+
+    if not hits:
+        # Basename-only matches: suffix globs matched above already
+        if name_hit is not None:
+            hits.append(name_hit)
+        if _FORBIDDEN_RE is not None and parents:
+            m = _FORBIDDEN_RE.match(basename)
+            if m is not None:
+                hits.append(int(m.lastgroup[1:]))
+        if not hits:
+            return None
+    return FORBIDDEN_PATTERNS[min(hits)]
+
 
 def load_plan(path: str) -> dict:
-    """Load plan from YAML or JSON file."""
+    """Load plan from YAML or JSON file.
+
+    Parsed plans are cached until the file's mtime or size changes, so the
+    boundary and command checks of one verification share a single parse.
+    The returned dict is shared between callers and must not be mutated.
+    """
+    p = Path(path)
+    st = p.stat()
+    return _load_plan_cached(str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_plan_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse a plan file; mtime_ns and size only serve as cache keys."""
     p = Path(path)
     content = p.read_text()
 
@@ -102,8 +227,31 @@ def get_modified_files(worktree_path: str) -> list:
         )
 
 
-def validate_boundaries(task_id: str, tasks_file: str = "tasks.yaml") -> dict:
-    """Validate that only allowed files were modified."""
+def check_unauthorized_files(modified, allowed, exclude=()) -> list[str]:
+    """Return modified files outside the allowed set, sorted.
+
+    Args:
+        modified: Iterable of modified file paths
+        allowed: Allowed file paths (a set or frozenset avoids a copy)
+        exclude: Files already reported elsewhere (e.g. forbidden)
+    """
+    if not isinstance(allowed, (set, frozenset)):
+        allowed = frozenset(allowed)
+    return sorted(set(modified).difference(allowed, exclude))
+
+
+def validate_boundaries(
+    task_id: str,
+    tasks_file: str = "tasks.yaml",
+    modified: list | None = None
+) -> dict:
+    """Validate that only allowed files were modified.
+
+    Args:
+        task_id: Task identifier
+        tasks_file: Path to tasks YAML file
+        modified: Modified files if already known (computed when None)
+    """
     task = get_task_spec(tasks_file, task_id)
     if task is None:
         return {"valid": False, "error": f"Task {task_id} not found"}
@@ -112,31 +260,15 @@ def validate_boundaries(task_id: str, tasks_file: str = "tasks.yaml") -> dict:
     if not Path(worktree_path).exists():
         return {"valid": False, "error": f"Worktree not found: {worktree_path}"}
 
-    try:
-        modified = get_modified_files(worktree_path)
-    except DiffError as e:
-        return {"valid": False, "error": str(e)}
-    allowed = set(task.get("files_write", []))
-
-    # Check for unauthorized modifications
-    unauthorized = []
-    forbidden = []
-
-    for f in modified:
-        # Check forbidden patterns using fnmatch for proper glob support
-        for pattern in FORBIDDEN_PATTERNS:
-            if pattern.endswith("/"):
-                # Directory pattern: check if file is under this directory
-                if f.startswith(pattern) or f"/{pattern}" in f:
-                    forbidden.append(f)
-                    break
-            elif fnmatch.fnmatch(f, pattern) or fnmatch.fnmatch(f.split("/")[-1], pattern):
-                forbidden.append(f)
-                break
-        else:
-            # Check if in allowed list
-            if f not in allowed:
-                unauthorized.append(f)
+    if modified is None:
+        try:
+            modified = get_modified_files(worktree_path)
+        except DiffError as e:
+            return {"valid": False, "error": str(e)}
+    allowed = frozenset(task.get("files_write", []))
+
+    forbidden = [f for f in modified if check_forbidden_patterns(f) is not None]
+    unauthorized = check_unauthorized_files(modified, allowed, exclude=forbidden)
 
     return {
         "valid": len(unauthorized) == 0 and len(forbidden) == 0,
@@ -147,6 +279,97 @@ def validate_boundaries(task_id: str, tasks_file: str = "tasks.yaml") -> dict:
     }
 
 
+def _get_head_tree(worktree_path: str) -> str | None:
+    """Return the tree hash of a worktree's HEAD, or None if it has no commits."""
+    result = subprocess.run(
+        ["git", "rev-parse", "HEAD^{tree}"],
+        cwd=worktree_path,
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _hash_file_contents(worktree_path: str, files: list) -> str:
+    """Hash the current contents of files (sorted) in a worktree."""
+    digest = hashlib.sha256()
+    for name in sorted(files):
+        digest.update(name.encode() + b"\0")
+        try:
+            digest.update(hashlib.sha256(Path(worktree_path, name).read_bytes()).digest())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def _worktree_state(worktree_path: str) -> str | None:
+    """Fingerprint everything in a worktree that differs from its HEAD commit.
+
+    Hashes the porcelain status (staged, unstaged, deleted and untracked
+    paths) together with the current contents of every listed file, so any
+    uncommitted edit changes the result. Returns None if git cannot report
+    the status.
+    """
+    result = subprocess.run(
+        ["git", "status", "--porcelain", "-z", "--untracked-files=all", "--no-renames"],
+        cwd=worktree_path,
+        capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        return None
+    # Each NUL-terminated entry is "XY path"
+    paths = [entry[3:] for entry in result.stdout.split("\0") if entry]
+    digest = hashlib.sha256(result.stdout.encode())
+    digest.update(_hash_file_contents(worktree_path, paths).encode())
+    return digest.hexdigest()
+
+
+def _verification_cache_context(worktree_path: str) -> str | None:
+    """Everything besides the command that a verification result depends on.
+
+    Combines the HEAD tree (all committed content), the uncommitted and
+    untracked state of the worktree and its environment hash. Returns None
+    when the worktree has no commits or its status cannot be read, in which
+    case nothing is cached.
+    """
+    tree = _get_head_tree(worktree_path)
+    if tree is None:
+        return None
+    state = _worktree_state(worktree_path)
+    if state is None:
+        return None
+    from environment import compute_env_hash
+    env_hash, _ = compute_env_hash(Path(worktree_path))
+    return "\0".join([tree, state, env_hash])
+
+
+def _verification_cache_key(command: str, context: str) -> str:
+    return hashlib.sha256(f"{command}\0{context}".encode()).hexdigest()
+
+
+def load_verification_cache() -> dict:
+    """Load cached verification results ({} if missing or unreadable)."""
+    try:
+        cache = json.loads(VERIFICATION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_verification_cache(new_entries: dict) -> None:
+    """Merge new entries into the cache file, keeping the most recent ones."""
+    if not new_entries:
+        return
+    from state import atomic_write_json
+    cache = load_verification_cache()
+    cache.update(new_entries)
+    if len(cache) > MAX_CACHE_ENTRIES:
+        newest = sorted(cache.items(), key=lambda kv: kv[1].get("verified_at", ""))
+        cache = dict(newest[-MAX_CACHE_ENTRIES:])
+    atomic_write_json(VERIFICATION_CACHE_FILE, cache)
+
+
 def validate_task_verification(task: dict) -> tuple[bool, str]:
     """Validate that a task has proper verification commands.
 
@@ -172,17 +395,113 @@ def validate_task_verification(task: dict) -> tuple[bool, str]:
     return True, ""
 
 
+def _read_tail(fh, max_bytes: int) -> str:
+    """Read at most the last max_bytes of a spooled output file."""
+    size = fh.seek(0, os.SEEK_END)
+    fh.seek(max(0, size - max_bytes))
+    return fh.read().decode("utf-8", errors="replace")
+
+
+# Verification commands run in their own process group so a timeout or
+# cancellation kills the whole tree (shell, pytest workers, node, ...), not
+# just the shell, leaving no orphans to starve later checks of CPU.
+if os.name == "nt":
+    _PROCESS_GROUP_KWARGS = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    _PROCESS_GROUP_KWARGS = {"start_new_session": True}
+
+
+def _kill_process(proc: subprocess.Popen) -> None:
+    """Kill a verification command and all of its descendants, then reap it."""
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(proc.pid, signal.SIGKILL)
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+
+def run_check_command(
+    command: str,
+    cwd: str,
+    timeout_seconds: int,
+    cancel: threading.Event | None = None
+) -> tuple[bool, str, str]:
+    """Run one verification command in a shell.
+
+    Output is spooled to temporary files rather than pipes, so verbose
+    checks (pytest -v, mypy) never hold their full output in memory; only
+    the last MAX_OUTPUT_BYTES of each stream are read back.
+
+    The command runs in a new session (POSIX) or process group (Windows);
+    on timeout or cancellation the entire group is killed, so processes the
+    shell spawned do not outlive the check.
+
+    Args:
+        command: Shell command to run
+        cwd: Working directory (the task worktree)
+        timeout_seconds: Kill the command after this many seconds
+        cancel: Optional event; when set, the command is killed early
+
+    Returns:
+        tuple of (passed, stdout_tail, stderr_tail)
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(
+            command, shell=True, cwd=cwd, stdout=out, stderr=err, **_PROCESS_GROUP_KWARGS
+        )
+        deadline = time.monotonic() + timeout_seconds
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _kill_process(proc)
+                return False, "", f"Timeout after {timeout_seconds} seconds"
+            try:
+                returncode = proc.wait(
+                    timeout=remaining if cancel is None else min(remaining, CANCEL_POLL_SECONDS)
+                )
+                break
+            except subprocess.TimeoutExpired:
+                if cancel is not None and cancel.is_set():
+                    _kill_process(proc)
+                    return False, "", "Cancelled: another required check failed"
+        return (
+            returncode == 0,
+            _read_tail(out, MAX_OUTPUT_BYTES),
+            _read_tail(err, MAX_OUTPUT_BYTES),
+        )
+
+
 def run_verification_commands(
     task_id: str,
     tasks_file: str = "tasks.yaml",
-    fail_fast: bool = True
+    fail_fast: bool = True,
+    cancel: threading.Event | None = None,
+    use_cache: bool = True,
+    modified: list | None = None
 ) -> dict:
     """Run all verification commands for a task.
 
+    Passed results are cached in VERIFICATION_CACHE_FILE, keyed on the
+    resolved command, the worktree's HEAD tree, its uncommitted and untracked
+    changes and the environment hash. A command whose key is cached is not
+    re-run (retries, repeated verification of unchanged work). Failed
+    results are never cached.
+
     Args:
         task_id: Task identifier
         tasks_file: Path to tasks YAML file
         fail_fast: If True, stop on first required command failure (default True)
+        cancel: Optional event set by a concurrent check that already failed;
+            the running command is killed and no further commands start
+        use_cache: If False, run every command and leave the cache untouched
+        modified: Modified files if already known (computed when None)
     """
     task = get_task_spec(tasks_file, task_id)
     if task is None:
@@ -197,60 +516,83 @@ def run_verification_commands(
     if not Path(worktree_path).exists():
         return {"success": False, "error": f"Worktree not found: {worktree_path}"}
 
+    # Resolved once for all commands' {modified_files} placeholders
+    if modified is None:
+        try:
+            modified = get_modified_files(worktree_path)
+        except DiffError as e:
+            return {"success": False, "error": f"Cannot resolve modified files: {e}"}
+    quoted_modified = " ".join(shlex.quote(f) for f in modified)
+
     results = []
     all_passed = True
+    cache = load_verification_cache() if use_cache else {}
+    cache_context = None
+    new_cache_entries = {}
 
     for verification in task.get("verification", []):
+        if cancel is not None and cancel.is_set():
+            save_verification_cache(new_cache_entries)
+            return {
+                "success": False,
+                "results": results,
+                "passed": sum(1 for r in results if r["passed"]),
+                "failed": sum(1 for r in results if not r["passed"]),
+                "cancelled": True
+            }
+
         command = verification.get("command", "")
         vtype = verification.get("type", "check")
         required = verification.get("required", True)
 
         # Resolve placeholders (shell-escape each filename to prevent injection)
-        try:
-            modified_files = get_modified_files(worktree_path)
-        except DiffError as e:
-            return {"success": False, "error": f"Cannot resolve modified files: {e}"}
-        command = command.replace(
-            "{modified_files}",
-            " ".join(shlex.quote(f) for f in modified_files)
-        )
+        command = command.replace("{modified_files}", quoted_modified)
 
         # Run command with configurable timeout (default 5 minutes, allow up to 10)
         timeout_seconds = verification.get("timeout", 300)
         if timeout_seconds > 600:
             timeout_seconds = 600  # Cap at 10 minutes
 
-        try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                cwd=worktree_path,
-                capture_output=True,
-                text=True,
-                timeout=timeout_seconds
-            )
-            passed = result.returncode == 0
-        except subprocess.TimeoutExpired:
-            passed = False
-            result = type('obj', (object,), {
-                'stdout': '',
-                'stderr': f'Timeout after {timeout_seconds} seconds'
-            })()
+        cache_key = None
+        if use_cache:
+            if cache_context is None:
+                cache_context = _verification_cache_context(worktree_path)
+            if cache_context is not None:
+                cache_key = _verification_cache_key(command, cache_context)
+
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is not None and cached.get("passed"):
+            passed, stdout, stderr = True, cached.get("output", ""), ""
+        else:
+            cached = None
+            started = time.monotonic()
+            passed, stdout, stderr = run_check_command(command, worktree_path, timeout_seconds, cancel)
+            if passed and cache_key:
+                new_cache_entries[cache_key] = {
+                    "passed": True,
+                    "output": stdout,
+                    "duration_ms": int((time.monotonic() - started) * 1000),
+                    "verified_at": datetime.now().isoformat()
+                }
 
         if required and not passed:
             all_passed = False
 
-        results.append({
+        result = {
             "command": command,
             "type": vtype,
             "required": required,
             "passed": passed,
-            "stdout": result.stdout[:1000] if passed else "",
-            "stderr": result.stderr[:1000] if not passed else ""
-        })
+            "stdout": stdout if passed else "",
+            "stderr": stderr if not passed else ""
+        }
+        if cached is not None:
+            result["cached"] = True
+        results.append(result)
 
         # Fail-fast: stop on first required command failure
         if fail_fast and required and not passed:
+            save_verification_cache(new_cache_entries)
             return {
                 "success": False,
                 "results": results,
@@ -260,6 +602,7 @@ def run_verification_commands(
                 "failed_at": command
             }
 
+    save_verification_cache(new_cache_entries)
     return {
         "success": all_passed,
         "results": results,
@@ -268,20 +611,59 @@ def run_verification_commands(
     }
 
 
-def full_verify(task_id: str, tasks_file: str = "tasks.yaml", env_hash: str = None) -> dict:
-    """Run full verification suite."""
-    # 1. Boundary check
-    boundary_result = validate_boundaries(task_id, tasks_file)
+def full_verify(
+    task_id: str,
+    tasks_file: str = "tasks.yaml",
+    env_hash: str = None,
+    fail_fast: bool = True,
+    use_cache: bool = True
+) -> dict:
+    """Run full verification suite.
+
+    The boundary check, verification commands and environment hash check are
+    independent and mostly wait on subprocesses or disk, so they run
+    concurrently: total time is bounded by the slowest check, not their sum.
+
+    With fail_fast, a failed boundary or environment check cancels the
+    verification commands still running, since the task fails regardless.
 
-    # 2. Verification commands
-    command_result = run_verification_commands(task_id, tasks_file)
+    The modified-file list is computed once here and shared by the boundary
+    check and the command placeholders.
+    """
+    modified = None
+    if Path(f".worktrees/{task_id}").exists():
+        # On failure each check re-runs the diff and reports the error itself
+        with contextlib.suppress(DiffError):
+            modified = get_modified_files(f".worktrees/{task_id}")
+
+    cancel = threading.Event()
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        # 1. Boundary check
+        boundary_future = pool.submit(validate_boundaries, task_id, tasks_file, modified)
+
+        # 2. Verification commands
+        command_future = pool.submit(
+            run_verification_commands, task_id, tasks_file, fail_fast, cancel, use_cache, modified
+        )
+
+        # 3. Environment hash check
+        env_future = None
+        if env_hash:
+            from environment import verify_env_hash
+            worktree_path = Path(f".worktrees/{task_id}")
+            env_future = pool.submit(verify_env_hash, env_hash, worktree_path)
+
+        boundary_result = boundary_future.result()
+        if fail_fast and not boundary_result["valid"]:
+            cancel.set()
 
-    # 3. Environment hash check
-    env_valid = True
-    if env_hash:
-        from environment import verify_env_hash
-        worktree_path = Path(f".worktrees/{task_id}")
-        env_valid, actual, _ = verify_env_hash(env_hash, worktree_path)
+        env_valid = True
+        if env_future is not None:
+            env_valid, _, _ = env_future.result()
+            if fail_fast and not env_valid:
+                cancel.set()
+
+        command_result = command_future.result()
 
     all_valid = boundary_result["valid"] and command_result["success"] and env_valid
 
@@ -308,6 +690,8 @@ def main():
     cmd_parser = subparsers.add_parser("commands", help="Run verification commands")
     cmd_parser.add_argument("task_id", help="Task ID")
     cmd_parser.add_argument("tasks_file", nargs="?", default="tasks.yaml")
+    cmd_parser.add_argument("--no-cache", action="store_true",
+                            help="Re-run every command, ignoring cached results")
     cmd_parser.add_argument("--json", action="store_true")
 
     # full command
@@ -315,6 +699,8 @@ def main():
     full_parser.add_argument("task_id", help="Task ID")
     full_parser.add_argument("tasks_file", nargs="?", default="tasks.yaml")
     full_parser.add_argument("--env-hash", help="Expected environment hash")
+    full_parser.add_argument("--no-cache", action="store_true",
+                             help="Re-run every command, ignoring cached results")
     full_parser.add_argument("--json", action="store_true")
 
     args = parser.parse_args()
@@ -336,7 +722,9 @@ def main():
         sys.exit(0 if result["valid"] else 1)
 
     elif args.command == "commands":
-        result = run_verification_commands(args.task_id, args.tasks_file)
+        result = run_verification_commands(
+            args.task_id, args.tasks_file, use_cache=not args.no_cache
+        )
         if args.json:
             print(json.dumps(result, indent=2))
         else:
@@ -352,7 +740,9 @@ def main():
         sys.exit(0 if result["success"] else 1)
 
     elif args.command == "full":
-        result = full_verify(args.task_id, args.tasks_file, args.env_hash)
+        result = full_verify(
+            args.task_id, args.tasks_file, args.env_hash, use_cache=not args.no_cache
+        )
         if args.json:
             print(json.dumps(result, indent=2))
         else:
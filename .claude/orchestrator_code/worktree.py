@@ -12,15 +12,36 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 # Import from local git.py
 from git import CommandResult, run_command, get_repo_root, get_current_branch, abort_merge
 
+# Config overrides for spawning worktrees: no fsmonitor daemon startup and
+# no auto-gc triggered by the new branch ref
+WORKTREE_ADD_CONFIG = ["-c", "core.fsmonitor=false", "-c", "gc.auto=0"]
 
-@dataclass
+
+def _remove_tree(path: Path) -> None:
+    """Remove a directory tree.
+
+    On POSIX this shells out to ``rm -rf``, whose native unlink loop is much
+    faster than shutil.rmtree on large trees (virtualenvs, node_modules).
+    Falls back to shutil.rmtree elsewhere or if rm fails.
+    """
+    if os.name == "posix":
+        result = run_command(["rm", "-rf", "--", str(path)], timeout=600)
+        if result.returncode == 0:
+            return
+    shutil.rmtree(path)
+
+
+@dataclass(slots=True)
 class WorktreeInfo:
     """Information about a git worktree."""
 
@@ -47,6 +68,38 @@ class WorktreeManager:
         """
         self.repo_root = repo_root or get_repo_root() or Path.cwd()
         self.worktree_dir = self.repo_root / worktree_dir
+        # Concurrent `git worktree add` calls read each other's half-written
+        # .git/worktrees/<id> admin dirs and fail, so registration is serialized
+        self._registration_lock = threading.Lock()
+        self._cached_worktrees: list[WorktreeInfo] | None = None
+        self._cache_mtime: int | None = None
+
+    def _worktrees_admin_mtime(self) -> int | None:
+        """Modification time of .git/worktrees, which git touches on add/remove/prune.
+
+        Returns None when it cannot be used as a cache key (e.g. repo_root is
+        itself a linked worktree whose .git is a file).
+        """
+        git_dir = self.repo_root / ".git"
+        if not git_dir.is_dir():
+            return None
+        try:
+            return (git_dir / "worktrees").stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+
+    def _run_git(self, args: list[str]) -> CommandResult:
+        """Run git in the main repository without optional (index refresh) locks."""
+        return run_command(
+            ["git", *args],
+            cwd=self.repo_root,
+            env={**os.environ, "GIT_OPTIONAL_LOCKS": "0"},
+        )
+
+    def invalidate_cache(self) -> None:
+        """Drop the cached worktree list so the next lookup re-reads git."""
+        self._cached_worktrees = None
+        self._cache_mtime = None
 
     def create_worktree(
         self,
@@ -68,20 +121,58 @@ class WorktreeManager:
         # Ensure worktree directory exists
         self.worktree_dir.mkdir(parents=True, exist_ok=True)
 
-        # Clean up leftover branch from previous run if it exists
-        run_command(
-            ["git", "branch", "-D", branch_name],
-            cwd=self.repo_root,
-        )
+        with self._registration_lock:
+            # Clean up leftover branch from previous run if it exists
+            self._run_git(["branch", "-D", branch_name])
 
-        # Create worktree with new branch
-        result = run_command(
-            f"git worktree add -b {branch_name} {worktree_path} {base_branch}",
-            cwd=self.repo_root,
-        )
+            # Register worktree with new branch; files are checked out below
+            result = self._run_git([
+                *WORKTREE_ADD_CONFIG,
+                "worktree", "add", "--no-checkout", "-b", branch_name,
+                str(worktree_path), base_branch,
+            ])
+        self.invalidate_cache()
+
+        # Populate the working tree outside the lock, so concurrent creations
+        # (create_worktrees_bulk) overlap the slow part
+        if result.returncode == 0:
+            checkout = self._run_git([
+                "-C", str(worktree_path), *WORKTREE_ADD_CONFIG, "reset", "--hard", "--quiet",
+            ])
+            if checkout.returncode != 0:
+                result = checkout
 
         return worktree_path, result
 
+    def create_worktrees_bulk(
+        self,
+        task_ids: list[str],
+        base_branch: str = "main",
+        max_workers: int = 8,
+    ) -> list[tuple[Path, CommandResult]]:
+        """Create worktrees for several tasks concurrently.
+
+        Each creation is a couple of git subprocesses, so a thread pool
+        overlaps their startup and checkout I/O. Worktree registration is
+        serialized by create_worktree; only the checkouts run in parallel.
+
+        Args:
+            task_ids: Unique task identifiers
+            base_branch: Branch to base the worktrees on
+            max_workers: Maximum number of concurrent git invocations
+
+        Returns:
+            List of (worktree_path, CommandResult), in task_ids order
+        """
+        self.worktree_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(
+                lambda task_id: self.create_worktree(task_id, base_branch),
+                task_ids,
+            ))
+        self.invalidate_cache()
+        return results
+
     def delete_worktree(self, task_id: str, force: bool = False) -> CommandResult:
         """Delete a worktree.
 
@@ -93,21 +184,16 @@ class WorktreeManager:
             CommandResult from git worktree remove
         """
         worktree_path = self.worktree_dir / task_id
-        force_flag = "--force" if force else ""
+        force_flag = ["--force"] if force else []
 
-        result = run_command(
-            f"git worktree remove {force_flag} {worktree_path}",
-            cwd=self.repo_root,
-        )
+        result = self._run_git(["worktree", "remove", *force_flag, str(worktree_path)])
+        self.invalidate_cache()
 
         # Also delete the branch if it exists (use -d for safe delete,
         # -D only when force-deleting the worktree)
         branch_name = f"task/{task_id}"
         flag = "-D" if force else "-d"
-        run_command(
-            f"git branch {flag} {branch_name}",
-            cwd=self.repo_root,
-        )
+        self._run_git(["branch", flag, branch_name])
 
         return result
 
@@ -132,18 +218,13 @@ class WorktreeManager:
         branch_name = f"task/{task_id}"
 
         # Checkout target branch in main repo
-        checkout_result = run_command(
-            f"git checkout {target_branch}",
-            cwd=self.repo_root,
-        )
+        checkout_result = self._run_git(["checkout", target_branch])
+        self.invalidate_cache()
         if checkout_result.returncode != 0:
             return checkout_result
 
         # Merge the task branch
-        result = run_command(
-            f'git merge {branch_name} -m "Merge task {task_id}"',
-            cwd=self.repo_root,
-        )
+        result = self._run_git(["merge", branch_name, "-m", f"Merge task {task_id}"])
 
         # If merge failed, abort to prevent dirty repo state
         if result.returncode != 0:
@@ -162,16 +243,27 @@ class WorktreeManager:
 
         return result
 
-    def list_worktrees(self) -> list[WorktreeInfo]:
+    def list_worktrees(self, use_cache: bool = False) -> list[WorktreeInfo]:
         """List all worktrees.
 
+        Args:
+            use_cache: Reuse the previous listing unless .git/worktrees changed
+                since it was taken. Branch and commit fields may then lag
+                behind commits made inside a worktree.
+
         Returns:
             List of WorktreeInfo for all worktrees
         """
-        result = run_command(
-            "git worktree list --porcelain",
-            cwd=self.repo_root,
-        )
+        mtime = self._worktrees_admin_mtime()
+        if (
+            use_cache
+            and mtime is not None
+            and self._cached_worktrees is not None
+            and mtime == self._cache_mtime
+        ):
+            return list(self._cached_worktrees)
+
+        result = self._run_git(["worktree", "list", "--porcelain"])
 
         if result.returncode != 0:
             return []
@@ -179,60 +271,48 @@ class WorktreeManager:
         worktrees: list[WorktreeInfo] = []
         current_wt: dict[str, str] = {}
 
-        for line in result.stdout.strip().split("\n"):
+        # Entries are "key value" lines separated by blank lines; the trailing
+        # "" flushes the last entry through the same path as the others.
+        for line in result.stdout.splitlines() + [""]:
             if not line:
                 if current_wt:
-                    wt_path = Path(current_wt.get("worktree", ""))
-                    branch = current_wt.get("branch", "").replace("refs/heads/", "")
-                    commit = current_wt.get("HEAD", "")
-
-                    # Determine if this is a task worktree
-                    task_id = None
-                    if wt_path.parent == self.worktree_dir:
-                        task_id = wt_path.name
-                    elif branch.startswith("task/"):
-                        task_id = branch[5:]
-
-                    worktrees.append(
-                        WorktreeInfo(
-                            path=wt_path,
-                            branch=branch,
-                            commit=commit,
-                            task_id=task_id,
-                            is_main=wt_path == self.repo_root,
-                        )
-                    )
+                    worktrees.append(self._parse_worktree_entry(current_wt))
                     current_wt = {}
-            elif line.startswith("worktree "):
-                current_wt["worktree"] = line[9:]
-            elif line.startswith("HEAD "):
-                current_wt["HEAD"] = line[5:]
-            elif line.startswith("branch "):
-                current_wt["branch"] = line[7:]
-
-        # Handle last entry
-        if current_wt:
-            wt_path = Path(current_wt.get("worktree", ""))
-            branch = current_wt.get("branch", "").replace("refs/heads/", "")
-            commit = current_wt.get("HEAD", "")
-
-            task_id = None
-            if wt_path.parent == self.worktree_dir:
-                task_id = wt_path.name
-            elif branch.startswith("task/"):
-                task_id = branch[5:]
-
-            worktrees.append(
-                WorktreeInfo(
-                    path=wt_path,
-                    branch=branch,
-                    commit=commit,
-                    task_id=task_id,
-                    is_main=wt_path == self.repo_root,
-                )
-            )
+                continue
+            key, _, value = line.partition(" ")
+            current_wt[key] = value
+
+        self._cached_worktrees = worktrees
+        self._cache_mtime = mtime
+        return list(worktrees)
 
-        return worktrees
+    def _parse_worktree_entry(self, entry: dict[str, str]) -> WorktreeInfo:
+        """Build WorktreeInfo from one parsed porcelain entry.
+
+        Args:
+            entry: Mapping of porcelain keys (worktree, HEAD, branch) to values
+
+        Returns:
+            WorktreeInfo for the entry
+        """
+        wt_path = Path(entry.get("worktree", ""))
+        branch = entry.get("branch", "").replace("refs/heads/", "")
+        commit = entry.get("HEAD", "")
+
+        # Determine if this is a task worktree
+        task_id = None
+        if wt_path.parent == self.worktree_dir:
+            task_id = wt_path.name
+        elif branch.startswith("task/"):
+            task_id = branch[5:]
+
+        return WorktreeInfo(
+            path=wt_path,
+            branch=branch,
+            commit=commit,
+            task_id=task_id,
+            is_main=wt_path == self.repo_root,
+        )
 
     def get_worktree(self, task_id: str) -> WorktreeInfo | None:
         """Get worktree info for a specific task.
@@ -243,7 +323,7 @@ class WorktreeManager:
         Returns:
             WorktreeInfo if found, None otherwise
         """
-        worktrees = self.list_worktrees()
+        worktrees = self.list_worktrees(use_cache=True)
         for wt in worktrees:
             if wt.task_id == task_id:
                 return wt
@@ -278,7 +358,8 @@ class WorktreeManager:
             List of task IDs that were cleaned up
         """
         # Prune worktrees with missing working directories
-        run_command("git worktree prune", cwd=self.repo_root)
+        self._run_git(["worktree", "prune"])
+        self.invalidate_cache()
 
         # Find any remaining directories without worktree entries
         cleaned: list[str] = []
@@ -289,7 +370,7 @@ class WorktreeManager:
             for entry in self.worktree_dir.iterdir():
                 if entry.is_dir() and entry.name not in active_tasks:
                     # Stale directory - remove it
-                    shutil.rmtree(entry)
+                    _remove_tree(entry)
                     cleaned.append(entry.name)
 
         return cleaned
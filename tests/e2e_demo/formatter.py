@@ -5,6 +5,23 @@ This module implements the FormatterProtocol contract (version: 804534f).
 
 from typing import Union
 
+# Map operation names to symbols
+_OP_SYMBOLS = {
+    'add': '+',
+    'subtract': '-',
+    'multiply': '×',
+    'divide': '÷',
+    'power': '^',
+    'modulo': '%'
+}
+
+
+def _format_number(n: Union[int, float]) -> str:
+    """Format a number, showing integral floats without a decimal point."""
+    if isinstance(n, float) and n.is_integer():
+        return str(int(n))
+    return str(n)
+
 
 def format_result(operation: str, a: Union[int, float], b: Union[int, float], result: Union[int, float]) -> str:
     """Format a calculation result as a human-readable string.
@@ -26,28 +43,15 @@ def format_result(operation: str, a: Union[int, float], b: Union[int, float], re
         >>> format_result('multiply', 3, 7, 21)
         '3 × 7 = 21'
     """
-    # Map operation names to symbols
-    operation_symbols = {
-        'add': '+',
-        'subtract': '-',
-        'multiply': '×',
-        'divide': '÷',
-        'power': '^',
-        'modulo': '%'
-    }
-
-    # Get the symbol (default to the operation name if not found)
-    operation_lower = operation.lower()
-    symbol = operation_symbols.get(operation_lower, operation)
+    # Get the symbol (default to the operation name if not found); lowercase
+    # names, as passed by run_calculation, skip the .lower() call
+    symbol = _OP_SYMBOLS.get(operation)
+    if symbol is None:
+        symbol = _OP_SYMBOLS.get(operation.lower(), operation)
 
     # Format numbers - show integers without decimal point
-    def format_number(n: Union[int, float]) -> str:
-        if isinstance(n, float) and n.is_integer():
-            return str(int(n))
-        return str(n)
-
-    a_str = format_number(a)
-    b_str = format_number(b)
-    result_str = format_number(result)
+    a_str = _format_number(a)
+    b_str = _format_number(b)
+    result_str = _format_number(result)
 
     return f"{a_str} {symbol} {b_str} = {result_str}"
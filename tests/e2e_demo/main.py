@@ -4,9 +4,17 @@ This module ties together the calculator and formatter modules to provide
 a complete calculation and formatting pipeline.
 """
 
+from collections.abc import Callable
+
 from tests.e2e_demo.calculator import add, subtract
 from tests.e2e_demo.formatter import format_result
 
+# Supported operations, keyed by lowercase name
+_OPS: dict[str, Callable[[int | float, int | float], int | float]] = {
+    'add': add,
+    'subtract': subtract,
+}
+
 
 def run_calculation(operation: str, a: int | float, b: int | float) -> str:
     """Run a calculation and return a formatted result.
@@ -30,14 +38,11 @@ def run_calculation(operation: str, a: int | float, b: int | float) -> str:
     """
     operation_lower = operation.lower()
 
-    if operation_lower == 'add':
-        result = add(a, b)
-    elif operation_lower == 'subtract':
-        result = subtract(a, b)
-    else:
+    op = _OPS.get(operation_lower)
+    if op is None:
         raise ValueError(f"Unknown operation: {operation}")
 
-    return format_result(operation, a, b, result)
+    return format_result(operation_lower, a, b, op(a, b))
 
 
 def main():
@@ -0,0 +1,33 @@
+"""Property-based tests for calculator module."""
+
+import pytest
+
+pytest.importorskip("hypothesis")
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from tests.e2e_demo.calculator import add, subtract
+
+bounded = settings(max_examples=50, deadline=None)
+
+
+@bounded
+@given(st.integers(), st.integers())
+def test_add_commutative(a, b):
+    """Addition is commutative."""
+    assert add(a, b) == add(b, a)
+
+
+@bounded
+@given(st.integers(), st.integers())
+def test_subtract_anticommutative(a, b):
+    """Swapping subtraction operands negates the result."""
+    assert subtract(a, b) == -subtract(b, a)
+
+
+@bounded
+@given(st.integers(), st.integers())
+def test_subtract_inverts_add(a, b):
+    """Subtracting b undoes adding b."""
+    assert subtract(add(a, b), b) == a
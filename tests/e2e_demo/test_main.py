@@ -1,112 +1,103 @@
 """Integration tests for main module."""
 
+import importlib.util
+
 import pytest
 from tests.e2e_demo.main import run_calculation
 
-
-class TestRunCalculation:
-    """Test suite for run_calculation() function."""
-
-    def test_run_calculation_add(self):
-        """Test running an addition calculation."""
-        result = run_calculation('add', 10, 5)
-        assert '15' in result
-        assert '10' in result
-        assert '5' in result
-        assert '+' in result
-
-    def test_run_calculation_subtract(self):
-        """Test running a subtraction calculation."""
-        result = run_calculation('subtract', 10, 5)
-        assert '5' in result
-        assert '10' in result
-        assert '-' in result
-
-    def test_run_calculation_with_floats(self):
-        """Test running calculations with floating point numbers."""
-        result = run_calculation('add', 2.5, 3.7)
-        assert '2.5' in result
-        assert '3.7' in result
-        assert '6.2' in result
-
-    def test_run_calculation_with_negative_numbers(self):
-        """Test running calculations with negative numbers."""
-        result = run_calculation('add', -5, 3)
-        assert '-5' in result
-        assert '3' in result
-        assert '-2' in result
-
-        result = run_calculation('subtract', 5, 10)
-        assert '5' in result
-        assert '10' in result
-        assert '-5' in result
-
-    def test_run_calculation_case_insensitive(self):
-        """Test that operation names are case-insensitive."""
-        result1 = run_calculation('ADD', 10, 5)
-        result2 = run_calculation('add', 10, 5)
-        assert result1 == result2
-
-        result1 = run_calculation('SUBTRACT', 10, 5)
-        result2 = run_calculation('subtract', 10, 5)
-        assert result1 == result2
-
-    def test_run_calculation_with_zero(self):
-        """Test calculations involving zero."""
-        result = run_calculation('add', 0, 5)
-        assert '0' in result
-        assert '5' in result
-
-        result = run_calculation('subtract', 5, 0)
-        assert '5' in result
-        assert '0' in result
-
-    def test_run_calculation_large_numbers(self):
-        """Test calculations with large numbers."""
-        result = run_calculation('add', 1000000, 2000000)
-        assert '3000000' in result
-
-    def test_run_calculation_unknown_operation(self):
-        """Test that unknown operations raise ValueError."""
-        with pytest.raises(ValueError, match="Unknown operation"):
-            run_calculation('multiply', 5, 3)
-
-        with pytest.raises(ValueError, match="Unknown operation"):
-            run_calculation('invalid', 10, 2)
-
-    def test_integration_add_chain(self):
-        """Test a chain of addition operations."""
-        # This tests the integration of calculator and formatter
-        result1 = run_calculation('add', 5, 3)
-        assert '8' in result1
-
-        result2 = run_calculation('add', 8, 2)
-        assert '10' in result2
-
-    def test_integration_mixed_operations(self):
-        """Test mixed operations using the integrated system."""
-        # Add then use result conceptually for next operation
-        add_result = run_calculation('add', 20, 5)
-        assert '25' in add_result
-
-        sub_result = run_calculation('subtract', 25, 10)
-        assert '15' in sub_result
-
-    def test_verification_requirement(self):
-        """Test the exact verification requirement from task spec."""
-        result = run_calculation('add', 10, 5)
-        assert '15' in result
-        print('Main integration OK')
-
-    def test_float_display_as_integer(self):
-        """Test that floats like 5.0 are displayed as 5."""
-        result = run_calculation('add', 2.0, 3.0)
-        assert '2 + 3 = 5' in result or ('2' in result and '3' in result and '5' in result)
-
-    def test_result_format_structure(self):
-        """Test that results follow expected format structure."""
-        result = run_calculation('add', 7, 3)
-        # Should be in format "a + b = result"
-        parts = result.split('=')
-        assert len(parts) == 2
-        assert '10' in parts[1].strip()
+requires_benchmark = pytest.mark.skipif(
+    importlib.util.find_spec("pytest_benchmark") is None,
+    reason="pytest-benchmark not installed",
+)
+
+
+def contains_all(result, *needles):
+    """Whether every needle is a whole whitespace-separated token of result.
+
+    Token matching avoids false positives such as '15' matching '150'.
+    """
+    return set(needles).issubset(result.split())
+
+
+@pytest.mark.parametrize("operation,a,b,expected_parts", [
+    ('add', 10, 5, ['15', '10', '5', '+']),
+    ('subtract', 10, 5, ['5', '10', '-']),
+    # floats
+    ('add', 2.5, 3.7, ['2.5', '3.7', '6.2']),
+    # negative numbers
+    ('add', -5, 3, ['-5', '3', '-2']),
+    ('subtract', 5, 10, ['5', '10', '-5']),
+    # zero
+    ('add', 0, 5, ['0', '5']),
+    ('subtract', 5, 0, ['5', '0']),
+    # large numbers
+    ('add', 1000000, 2000000, ['3000000']),
+])
+def test_run_calculation(operation, a, b, expected_parts):
+    """Test that the output contains the operands, symbol and result."""
+    result = run_calculation(operation, a, b)
+    assert contains_all(result, *expected_parts), result
+
+
+@pytest.mark.parametrize("operation", ['add', 'subtract'])
+def test_run_calculation_case_insensitive(operation):
+    """Test that operation names are case-insensitive."""
+    assert run_calculation(operation.upper(), 10, 5) == run_calculation(operation, 10, 5)
+
+
+@pytest.mark.parametrize("operation,a,b", [('multiply', 5, 3), ('invalid', 10, 2)])
+def test_run_calculation_unknown_operation(operation, a, b):
+    """Test that unknown operations raise ValueError."""
+    with pytest.raises(ValueError, match="Unknown operation"):
+        run_calculation(operation, a, b)
+
+
+def test_integration_add_chain():
+    """Test a chain of addition operations."""
+    # This tests the integration of calculator and formatter
+    assert contains_all(run_calculation('add', 5, 3), '8')
+    assert contains_all(run_calculation('add', 8, 2), '10')
+
+
+def test_integration_mixed_operations():
+    """Test mixed operations using the integrated system."""
+    # Add then use result conceptually for next operation
+    assert contains_all(run_calculation('add', 20, 5), '25')
+    assert contains_all(run_calculation('subtract', 25, 10), '15')
+
+
+def test_verification_requirement():
+    """Test the exact verification requirement from task spec."""
+    result = run_calculation('add', 10, 5)
+    assert '15' in result
+    print('Main integration OK')
+
+
+def test_float_display_as_integer():
+    """Test that floats like 5.0 are displayed as 5."""
+    result = run_calculation('add', 2.0, 3.0)
+    assert '2 + 3 = 5' in result or contains_all(result, '2', '3', '5')
+
+
+def test_result_format_structure():
+    """Test that results follow expected format structure."""
+    result = run_calculation('add', 7, 3)
+    # Should be in format "a + b = result"
+    parts = result.split('=')
+    assert len(parts) == 2
+    assert '10' in parts[1].strip()
+
+
+# Performance regression guards for run_calculation().
+#
+# Save a baseline on main with ``pytest --benchmark-save=baseline`` and
+# compare on branches with
+# ``pytest --benchmark-compare --benchmark-compare-fail=mean:10%``.
+@requires_benchmark
+@pytest.mark.parametrize("operation", ['add', 'subtract'])
+def test_run_calculation_perf(benchmark, operation):
+    """Benchmark dispatch plus formatting for each operation."""
+    result = benchmark.pedantic(
+        run_calculation, args=(operation, 10, 5), rounds=50, iterations=1000
+    )
+    assert '10' in result
@@ -2,76 +2,126 @@
 
 These tests require git to be installed and available.
 They create actual git repositories for testing.
+
+Every test works in its own tmp_path clone, so the module is safe to run
+in parallel with pytest-xdist:
+
+    pytest -n auto tests/integration/test_worktree.py
 """
 
+from __future__ import annotations
+
+import os
 import subprocess
 import tempfile
 from pathlib import Path
+from subprocess import DEVNULL
+from typing import TYPE_CHECKING
 
 import pytest
 
-from claude_orchestrator.worktree.manager import WorktreeManager
+if TYPE_CHECKING:
+    from claude_orchestrator.worktree.manager import WorktreeManager
 
+# Read-only git commands must not take index.lock (parallel xdist workers)
+GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
 
-@pytest.fixture
-def git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository for testing."""
-    repo_path = tmp_path / "test_repo"
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Build the initial repository once per session; tests clone it."""
+    repo_path = tmp_path_factory.mktemp("template") / "test_repo"
     repo_path.mkdir()
 
     # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, capture_output=True, check=True)
     subprocess.run(
-        ["git", "config", "user.email", "test@test.com"],
+        ["git", "init", "--initial-branch=main"],
         cwd=repo_path,
-        capture_output=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
         check=True,
+        env=GIT_ENV,
     )
+
+    # Create initial commit
+    (repo_path / "README.md").write_text("# Test Repo")
     subprocess.run(
-        ["git", "config", "user.name", "Test User"],
+        ["git", "add", "README.md"],
         cwd=repo_path,
-        capture_output=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
         check=True,
+        env=GIT_ENV,
     )
-
-    # Create initial commit
-    (repo_path / "README.md").write_text("# Test Repo")
-    subprocess.run(["git", "add", "README.md"], cwd=repo_path, capture_output=True, check=True)
     subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
+        [
+            "git",
+            "-c", "user.email=test@test.com",
+            "-c", "user.name=Test User",
+            "commit", "-m", "Initial commit",
+        ],
         cwd=repo_path,
-        capture_output=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
         check=True,
+        env=GIT_ENV,
     )
 
-    # Create main branch if not exists
-    subprocess.run(["git", "branch", "-M", "main"], cwd=repo_path, capture_output=True)
+    return repo_path
+
 
+@pytest.fixture
+def git_repo(_git_repo_template: Path, tmp_path: Path) -> Path:
+    """Create a temporary git repository for testing.
+
+    Clones the session template (a single git invocation) instead of
+    re-initializing and committing for every test.
+    """
+    repo_path = tmp_path / "test_repo"
+    subprocess.run(
+        [
+            "git", "clone", "--local", "--no-hardlinks",
+            "-c", "user.email=test@test.com",
+            "-c", "user.name=Test User",
+            str(_git_repo_template), str(repo_path),
+        ],
+        stdout=DEVNULL,
+        stderr=DEVNULL,
+        check=True,
+        env=GIT_ENV,
+    )
     return repo_path
 
 
+@pytest.fixture
+def manager(git_repo: Path) -> WorktreeManager:
+    """WorktreeManager for the per-test repository."""
+    # Imported here so collection (e.g. --collect-only) skips the manager's imports
+    from claude_orchestrator.worktree.manager import WorktreeManager
+
+    return WorktreeManager(repo_root=git_repo)
+
+
+@pytest.fixture
+def task_a(manager: WorktreeManager) -> Path:
+    """Worktree for task-a, created through the manager."""
+    worktree_path, _ = manager.create_worktree("task-a")
+    return worktree_path
+
+
 class TestWorktreeManager:
     """Integration tests for WorktreeManager."""
 
-    def test_create_worktree(self, git_repo: Path) -> None:
+    def test_create_worktree(self, manager: WorktreeManager) -> None:
         """Test creating a worktree."""
-        manager = WorktreeManager(repo_root=git_repo)
         worktree_path, result = manager.create_worktree("task-a")
 
         assert result.returncode == 0
         assert worktree_path.exists()
         assert (worktree_path / "README.md").exists()
 
-        # Clean up
-        manager.delete_worktree("task-a", force=True)
-
-    def test_list_worktrees(self, git_repo: Path) -> None:
+    def test_list_worktrees(self, manager: WorktreeManager, task_a: Path) -> None:
         """Test listing worktrees."""
-        manager = WorktreeManager(repo_root=git_repo)
-
-        # Create a worktree
-        manager.create_worktree("task-a")
-
         worktrees = manager.list_worktrees()
 
         # Should have at least 2: main and task-a
@@ -81,13 +131,8 @@ class TestWorktreeManager:
         assert task_worktree is not None
         assert task_worktree.branch == "task/task-a"
 
-        # Clean up
-        manager.delete_worktree("task-a", force=True)
-
-    def test_worktree_exists(self, git_repo: Path) -> None:
+    def test_worktree_exists(self, manager: WorktreeManager) -> None:
         """Test checking worktree existence."""
-        manager = WorktreeManager(repo_root=git_repo)
-
         assert not manager.worktree_exists("task-a")
 
         manager.create_worktree("task-a")
@@ -96,46 +141,45 @@ class TestWorktreeManager:
         manager.delete_worktree("task-a", force=True)
         assert not manager.worktree_exists("task-a")
 
-    def test_get_worktree(self, git_repo: Path) -> None:
-        """Test getting worktree info."""
-        manager = WorktreeManager(repo_root=git_repo)
-
+    def test_get_worktree_missing(self, manager: WorktreeManager) -> None:
+        """Test getting info for a worktree that does not exist."""
         assert manager.get_worktree("task-a") is None
 
-        manager.create_worktree("task-a")
+    def test_get_worktree(self, manager: WorktreeManager, task_a: Path) -> None:
+        """Test getting worktree info."""
         wt = manager.get_worktree("task-a")
 
         assert wt is not None
         assert wt.task_id == "task-a"
         assert wt.branch == "task/task-a"
 
-        manager.delete_worktree("task-a", force=True)
-
-    def test_delete_worktree(self, git_repo: Path) -> None:
+    def test_delete_worktree(self, manager: WorktreeManager, task_a: Path) -> None:
         """Test deleting a worktree."""
-        manager = WorktreeManager(repo_root=git_repo)
-
-        worktree_path, _ = manager.create_worktree("task-a")
-        assert worktree_path.exists()
+        assert task_a.exists()
 
         result = manager.delete_worktree("task-a", force=True)
         assert result.returncode == 0
-        assert not worktree_path.exists()
+        assert not task_a.exists()
 
-    def test_merge_worktree(self, git_repo: Path) -> None:
+    def test_merge_worktree(
+        self, git_repo: Path, manager: WorktreeManager, task_a: Path
+    ) -> None:
         """Test merging a worktree."""
-        manager = WorktreeManager(repo_root=git_repo)
-
-        # Create worktree and make changes
-        worktree_path, _ = manager.create_worktree("task-a")
-
         # Create a new file in the worktree
-        (worktree_path / "new_file.py").write_text("# New file")
-        subprocess.run(["git", "add", "new_file.py"], cwd=worktree_path, capture_output=True)
+        (task_a / "new_file.py").write_text("# New file")
+        subprocess.run(
+            ["git", "add", "new_file.py"],
+            cwd=task_a,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            env=GIT_ENV,
+        )
         subprocess.run(
             ["git", "commit", "-m", "Add new file"],
-            cwd=worktree_path,
-            capture_output=True,
+            cwd=task_a,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+            env=GIT_ENV,
         )
 
         # Merge back to main
@@ -145,10 +189,8 @@ class TestWorktreeManager:
         # New file should now be in main
         assert (git_repo / "new_file.py").exists()
 
-    def test_cleanup_all_worktrees(self, git_repo: Path) -> None:
+    def test_cleanup_all_worktrees(self, manager: WorktreeManager) -> None:
         """Test cleaning up all worktrees."""
-        manager = WorktreeManager(repo_root=git_repo)
-
         # Create multiple worktrees
         manager.create_worktree("task-a")
         manager.create_worktree("task-b")
@@ -164,10 +206,8 @@ class TestWorktreeManager:
         assert not manager.worktree_exists("task-b")
         assert not manager.worktree_exists("task-c")
 
-    def test_get_worktree_path(self, git_repo: Path) -> None:
+    def test_get_worktree_path(self, git_repo: Path, manager: WorktreeManager) -> None:
         """Test getting worktree path."""
-        manager = WorktreeManager(repo_root=git_repo)
-
         path = manager.get_worktree_path("task-a")
         expected = git_repo / ".worktrees" / "task-a"
 
@@ -177,25 +217,16 @@ class TestWorktreeManager:
 class TestWorktreeIsolation:
     """Tests for worktree isolation behavior."""
 
-    def test_changes_isolated_to_worktree(self, git_repo: Path) -> None:
+    def test_changes_isolated_to_worktree(self, git_repo: Path, task_a: Path) -> None:
         """Test that changes in worktree don't affect main."""
-        manager = WorktreeManager(repo_root=git_repo)
-
-        worktree_path, _ = manager.create_worktree("task-a")
-
         # Make changes in worktree
-        (worktree_path / "worktree_only.py").write_text("# Worktree only")
+        (task_a / "worktree_only.py").write_text("# Worktree only")
 
         # Main should not have this file
         assert not (git_repo / "worktree_only.py").exists()
 
-        # Clean up
-        manager.delete_worktree("task-a", force=True)
-
-    def test_worktrees_independent(self, git_repo: Path) -> None:
+    def test_worktrees_independent(self, manager: WorktreeManager) -> None:
         """Test that worktrees are independent of each other."""
-        manager = WorktreeManager(repo_root=git_repo)
-
         wt_a, _ = manager.create_worktree("task-a")
         wt_b, _ = manager.create_worktree("task-b")
 
@@ -209,6 +240,3 @@ class TestWorktreeIsolation:
 
         assert (wt_b / "file_b.py").exists()
         assert not (wt_b / "file_a.py").exists()
-
-        # Clean up
-        manager.cleanup_all_worktrees(force=True)
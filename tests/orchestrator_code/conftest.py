@@ -0,0 +1,12 @@
+"""Shared setup for tests of the standalone scripts in .claude/orchestrator_code.
+
+The scripts import each other as top-level modules (``from git import ...``),
+so their directory goes first on sys.path, as it is when they run directly.
+"""
+
+import sys
+from pathlib import Path
+
+ORCHESTRATOR_CODE = Path(__file__).resolve().parents[2] / ".claude" / "orchestrator_code"
+
+sys.path.insert(0, str(ORCHESTRATOR_CODE))
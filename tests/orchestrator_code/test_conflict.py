@@ -0,0 +1,98 @@
+"""Tests for conflict.py."""
+
+from __future__ import annotations
+
+import conflict
+import dag
+
+
+def make_task(
+    task_id: str,
+    depends_on: list[str] | None = None,
+    files_write: list[str] | None = None,
+) -> dict:
+    """Helper to create a plan task dict for testing."""
+    return {
+        "id": task_id,
+        "depends_on": depends_on or [],
+        "files_write": files_write or [],
+    }
+
+
+def apply_fix(tasks: list[dict], fix: str) -> list[dict]:
+    """Copy of tasks with every "x depends_on [y]" link of a suggestion added."""
+    links = fix.removeprefix("Add dependency: ").split("; ")
+    added = {}
+    for link in links:
+        later, _, earlier = link.partition(" depends_on ")
+        added.setdefault(later, []).append(earlier.strip("[]"))
+    return [{**t, "depends_on": t["depends_on"] + added.get(t["id"], [])} for t in tasks]
+
+
+class TestDetectConflicts:
+    """Tests for detect_conflicts."""
+
+    def test_partially_ordered_writers_conflict(self) -> None:
+        """Test one ordered pair does not make the other writers safe."""
+        tasks = [
+            make_task("a", files_write=["src/util.py"]),
+            make_task("c", depends_on=["a"], files_write=["src/util.py"]),
+            make_task("e", files_write=["src/util.py"]),
+        ]
+        conflicts = conflict.detect_conflicts(tasks)
+
+        assert len(conflicts) == 1
+        assert conflicts[0]["type"] == "file_write_write"
+        assert conflicts[0]["target"] == "src/util.py"
+        assert set(conflicts[0]["tasks"]) == {"a", "c", "e"}
+
+    def test_fully_chained_writers_do_not_conflict(self) -> None:
+        """Test writers ordered by a transitive chain are not reported."""
+        tasks = [
+            make_task("a", files_write=["src/util.py"]),
+            make_task("b", depends_on=["a"], files_write=["src/util.py"]),
+            make_task("c", depends_on=["b"], files_write=["src/util.py"]),
+        ]
+
+        assert conflict.detect_conflicts(tasks) == []
+
+
+class TestSuggestFix:
+    """Tests for suggest_fix."""
+
+    def test_follows_dependency_order(self) -> None:
+        """Test a plan listed against its dependency order gets no cycle."""
+        tasks = [
+            make_task("b", depends_on=["a"], files_write=["src/util.py"]),
+            make_task("a", files_write=["src/util.py"]),
+            make_task("x", files_write=["src/util.py"]),
+        ]
+        reachable = conflict._compute_reachable(tasks)
+        [found] = conflict.detect_conflicts(tasks, reachable)
+        fix = conflict.suggest_fix(found, reachable)
+        fixed = apply_fix(tasks, fix)
+
+        assert "a depends_on [b]" not in fix
+        assert dag.detect_cycles(fixed) is None
+        assert conflict.detect_conflicts(fixed) == []
+
+    def test_skips_links_already_implied(self) -> None:
+        """Test dependencies the plan already has are not suggested again."""
+        tasks = [
+            make_task("a", files_write=["src/util.py"]),
+            make_task("b", depends_on=["a"], files_write=["src/util.py"]),
+            make_task("c", depends_on=["b"], files_write=["src/util.py"]),
+            make_task("x", files_write=["src/util.py"]),
+        ]
+        reachable = conflict._compute_reachable(tasks)
+        [found] = conflict.detect_conflicts(tasks, reachable)
+        fix = conflict.suggest_fix(found, reachable)
+
+        assert fix == "Add dependency: x depends_on [a]; b depends_on [x]"
+        assert conflict.detect_conflicts(apply_fix(tasks, fix)) == []
+
+    def test_without_reachable_chains_listed_order(self) -> None:
+        """Test the chain follows the listed order when no closure is given."""
+        found = {"type": "file_write_write", "target": "f.py", "tasks": ["a", "c", "e"]}
+
+        assert conflict.suggest_fix(found) == "Add dependency: c depends_on [a]; e depends_on [c]"
@@ -0,0 +1,125 @@
+"""Tests for dag.py."""
+
+from __future__ import annotations
+
+import dag
+
+
+def make_task(task_id: str, depends_on: list[str] | None = None) -> dict:
+    """Helper to create a plan task dict for testing."""
+    return {"id": task_id, "depends_on": depends_on or []}
+
+
+def is_cycle(path: list[str], tasks: list[dict]) -> bool:
+    """Whether path is a closed walk where each task depends on the one before."""
+    deps = {t["id"]: t["depends_on"] for t in tasks}
+    return (
+        len(path) >= 2
+        and path[0] == path[-1]
+        and all(prev in deps[task] for prev, task in zip(path, path[1:], strict=False))
+    )
+
+
+class TestDetectCycles:
+    """Tests for detect_cycles."""
+
+    def test_no_cycles(self) -> None:
+        """Test an acyclic plan has no cycle."""
+        tasks = [make_task("a"), make_task("b", ["a"]), make_task("c", ["a", "b"])]
+
+        assert dag.detect_cycles(tasks) is None
+
+    def test_self_loop(self) -> None:
+        """Test a task depending on itself is reported as [a, a]."""
+        tasks = [make_task("x"), make_task("a", ["a"])]
+
+        assert dag.detect_cycles(tasks) == ["a", "a"]
+
+    def test_two_disjoint_cycles(self) -> None:
+        """Test one of two independent cycles is reported, without bystanders."""
+        tasks = [
+            make_task("a", ["b"]),
+            make_task("b", ["a"]),
+            make_task("c", ["d"]),
+            make_task("d", ["e"]),
+            make_task("e", ["c"]),
+            # Downstream of a cycle, but not on one
+            make_task("f", ["a", "c"]),
+        ]
+        cycle = dag.detect_cycles(tasks)
+
+        assert is_cycle(cycle, tasks)
+        assert set(cycle) in ({"a", "b"}, {"c", "d", "e"})
+
+    def test_duplicate_dependency_entries(self) -> None:
+        """Test a dependency listed twice is not mistaken for a cycle."""
+        tasks = [make_task("a"), make_task("b", ["a", "a"])]
+
+        assert dag.detect_cycles(tasks) is None
+
+    def test_deep_chain(self) -> None:
+        """Test long chains do not hit the recursion limit."""
+        tasks = [make_task("t0")] + [make_task(f"t{i}", [f"t{i - 1}"]) for i in range(1, 5000)]
+
+        assert dag.detect_cycles(tasks) is None
+
+
+class TestTopologicalSort:
+    """Tests for topological_sort."""
+
+    def test_diamond_waves(self) -> None:
+        """Test each wave holds tasks whose dependencies are all earlier."""
+        tasks = [make_task("a"), make_task("b", ["a"]), make_task("c", ["a"]), make_task("d", ["b", "c"])]
+
+        assert dag.topological_sort(tasks) == [["a"], ["b", "c"], ["d"]]
+
+    def test_duplicate_dependency_entries(self) -> None:
+        """Test a dependency listed twice still releases its dependent once."""
+        tasks = [make_task("a"), make_task("b", ["a", "a"]), make_task("c", ["b"])]
+
+        assert dag.topological_sort(tasks) == [["a"], ["b"], ["c"]]
+
+    def test_cycle(self) -> None:
+        """Test a cyclic plan cannot be sorted."""
+        tasks = [make_task("a", ["b"]), make_task("b", ["a"])]
+
+        assert dag.topological_sort(tasks) is None
+
+
+class TestComputeCriticalPath:
+    """Tests for compute_critical_path."""
+
+    def test_empty_plan(self) -> None:
+        """Test an empty plan has an empty critical path."""
+        assert dag.compute_critical_path([]) == []
+
+    def test_diamond_with_long_branch(self) -> None:
+        """Test the path follows the longer side of a diamond."""
+        #     a
+        #    / \
+        #   b   c
+        #   |   |
+        #   e   |
+        #    \ /
+        #     d
+        tasks = [
+            make_task("a"),
+            make_task("b", ["a"]),
+            make_task("c", ["a"]),
+            make_task("e", ["b"]),
+            make_task("d", ["c", "e"]),
+        ]
+
+        assert dag.compute_critical_path(tasks) == ["a", "b", "e", "d"]
+
+    def test_duplicate_dependency_entries(self) -> None:
+        """Test a dependency listed twice does not lengthen the path."""
+        tasks = [make_task("a"), make_task("b", ["a", "a"])]
+
+        assert dag.compute_critical_path(tasks) == ["a", "b"]
+
+    def test_cycle(self) -> None:
+        """Test a cyclic plan has no critical path."""
+        tasks = [make_task("a", ["a"])]
+
+        assert dag.compute_critical_path(tasks) is None
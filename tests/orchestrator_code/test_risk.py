@@ -0,0 +1,117 @@
+"""Tests for risk.py."""
+
+from __future__ import annotations
+
+import signal
+import threading
+
+import pytest
+import risk
+
+
+def make_plan(num_tasks: int = 7, num_contracts: int = 5) -> dict:
+    """Plan with every factor present: size, sensitive paths, deps, coverage."""
+    tasks = [
+        {
+            "id": f"task-{i}",
+            "files_write": [f"src/auth/mod{i}.py", f"src/feature{i}/a.py", f"src/feature{i}/b.py"],
+            "patch_intents": [{"file": "src/app.py"}],
+            "deps_required": {"runtime": [f"dep{i}"]},
+            "verification": [{"type": "test"}] if i % 2 else [],
+        }
+        for i in range(num_tasks)
+    ]
+    contracts = [{"name": f"Contract{i}"} for i in range(num_contracts)]
+    return {"tasks": tasks, "contracts": contracts}
+
+
+class TestMatchSensitivePattern:
+    """Tests for the sensitive-path matcher."""
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("src/auth/login.py", 0),
+            ("deploy/prod/auth.py", 0),  # several patterns match; the first listed wins
+            ("billing/Stripe.py", 1),  # case-insensitive
+            ("config/.env", 4),
+            ("src/db/schema.sql", 5),
+            ("docs/readme.md", None),
+            ("", None),
+        ],
+    )
+    def test_first_listed_pattern_wins(self, path: str, expected: int | None) -> None:
+        """Test the index of the first pattern, in table order, found in the path."""
+        compiled = risk._compile_sensitive_patterns(tuple(risk.DEFAULT_SENSITIVE_PATTERNS))
+
+        assert risk._match_sensitive_pattern(path, compiled) == expected
+
+    def test_invalid_patterns_are_skipped(self) -> None:
+        """Test rejected patterns are dropped, so indices refer to compiled_patterns."""
+        compiled = risk._compile_sensitive_patterns(((r"a*+", 10), (r"[", 5), (r"auth", 2)))
+
+        assert [raw for _, _, raw in compiled] == ["auth"]
+        assert risk._match_sensitive_pattern("src/auth.py", compiled) == 0
+
+
+class TestFastMode:
+    """Tests for compute_risk_score(fast=True)."""
+
+    def test_agrees_with_full_mode_below_threshold(self) -> None:
+        """Test fast mode returns the full result, factor order included, without an early exit."""
+        plan = make_plan()
+        config = {"sensitive_patterns": risk.DEFAULT_SENSITIVE_PATTERNS, "auto_approve_threshold": 10_000}
+
+        full = risk.compute_risk_score(plan, config)
+
+        assert full["factors"][0].startswith("sensitive_path:")
+        assert {"many_tasks", "many_contracts"} <= set(full["factor_categories"])
+        assert risk.compute_risk_score(plan, config, fast=True) == full
+
+    @pytest.mark.parametrize("threshold", [0, 20, 60, 120])
+    def test_early_exit_keeps_auto_approve_and_factor_order(self, threshold: int) -> None:
+        """Test an early exit still decides approval exactly, reporting factors in full-mode order."""
+        plan = make_plan()
+        config = {"sensitive_patterns": risk.DEFAULT_SENSITIVE_PATTERNS, "auto_approve_threshold": threshold}
+
+        full = risk.compute_risk_score(plan, config)
+        fast = risk.compute_risk_score(plan, config, fast=True)
+
+        assert fast["auto_approve"] == full["auto_approve"]
+        assert fast["score"] <= full["score"]
+        order = [full["factors"].index(factor) for factor in fast["factors"]]
+        assert order == sorted(order)
+
+    def test_negative_weight_disables_early_exit(self) -> None:
+        """Test a pattern that lowers the score keeps fast-mode approval exact."""
+        plan = {"tasks": [{"id": "t", "files_write": ["auth.py", "tests/x.py"], "verification": [{"type": "test"}]}]}
+        config = {"sensitive_patterns": [("auth", 30), ("tests", -20)], "auto_approve_threshold": 25}
+
+        full = risk.compute_risk_score(plan, config)
+
+        assert full["score"] == 10
+        assert full["auto_approve"] is True
+        assert risk.compute_risk_score(plan, config, fast=True) == full
+
+    def test_runs_off_the_main_thread(self) -> None:
+        """Test scoring from a worker thread, where SIGALRM handlers cannot be set."""
+        plan = make_plan()
+        results = []
+
+        thread = threading.Thread(target=lambda: results.append(risk.compute_risk_score(plan)))
+        thread.start()
+        thread.join()
+
+        assert results == [risk.compute_risk_score(plan)]
+
+    def test_no_files_leaves_signal_handler_alone(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a plan with nothing to match never installs the SIGALRM handler."""
+
+        def fail(*args: object) -> None:
+            raise AssertionError("signal handler installed")
+
+        monkeypatch.setattr(signal, "signal", fail)
+        plan = {"tasks": [{"id": "t", "verification": [{"type": "test"}]}]}
+
+        assert risk.compute_risk_score(plan)["score"] == 0
+        assert risk.compute_risk_score(plan, fast=True)["score"] == 0
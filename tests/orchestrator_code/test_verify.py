@@ -0,0 +1,114 @@
+"""Tests for verify.py."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+import verify
+
+
+def git(*args: str, cwd: Path) -> None:
+    """Run a git command quietly with a fixed committer identity."""
+    subprocess.run(
+        ["git", "-c", "user.email=test@test.com", "-c", "user.name=Test", *args],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+
+
+class TestCheckForbiddenPatterns:
+    """Tests for check_forbidden_patterns."""
+
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            # exact name, at the root or nested
+            (".env", ".env"),
+            ("config/.env", ".env"),
+            # *.ext suffix
+            ("src/mod.pyc", "*.pyc"),
+            ("poetry.lock", "*.lock"),
+            # directory component anywhere in the path
+            ("node_modules/a.js", "node_modules/"),
+            ("pkg/node_modules/x/index.js", "node_modules/"),
+            (".git/config", ".git/"),
+            # earliest pattern wins when several match
+            ("src/__pycache__/m.cpython-311.pyc", "__pycache__/"),
+        ],
+    )
+    def test_forbidden(self, path: str, expected: str) -> None:
+        """Test the pattern reported for a forbidden path."""
+        assert verify.check_forbidden_patterns(path) == expected
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "src/main.py",
+            ".envrc",
+            "environment.py",
+            "src/lockfile.py",
+            "a.lock.py",
+            "node_modules_backup/x.js",
+            "docs/env",
+        ],
+    )
+    def test_allowed(self, path: str) -> None:
+        """Test near-misses of each pattern are allowed."""
+        assert verify.check_forbidden_patterns(path) is None
+
+
+@pytest.fixture
+def task_worktree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Repository with a task-a worktree whose check passes.
+
+    b.txt comes from main, so it is not among the files of the task's last
+    commit. The test runs from the repository root, as verify.py expects.
+    """
+    git("init", "--initial-branch=main", cwd=tmp_path)
+    (tmp_path / "b.txt").write_text("ok\n")
+    git("add", "b.txt", cwd=tmp_path)
+    git("commit", "-m", "Initial commit", cwd=tmp_path)
+
+    worktree = tmp_path / ".worktrees" / "task-a"
+    git("worktree", "add", "-b", "task/task-a", str(worktree), "main", cwd=tmp_path)
+    (worktree / "a.txt").write_text("ok\n")
+    git("add", "a.txt", cwd=worktree)
+    git("commit", "-m", "Add a.txt", cwd=worktree)
+
+    plan = {"tasks": [{
+        "id": "task-a",
+        "files_write": ["a.txt"],
+        # Fails once any file in the worktree says "nope"
+        "verification": [{"command": "! grep -rqs --exclude-dir=.git nope .", "type": "test"}],
+    }]}
+    (tmp_path / "tasks.json").write_text(json.dumps(plan))
+    monkeypatch.chdir(tmp_path)
+    return worktree
+
+
+class TestVerificationCache:
+    """Tests for the verification result cache."""
+
+    def test_unchanged_worktree_uses_cache(self, task_worktree: Path) -> None:
+        """Test a second run of an unchanged worktree is served from cache."""
+        first = verify.run_verification_commands("task-a", "tasks.json")
+        second = verify.run_verification_commands("task-a", "tasks.json")
+
+        assert first["success"] and "cached" not in first["results"][0]
+        assert second["success"] and second["results"][0].get("cached")
+
+    @pytest.mark.parametrize("edited_file", ["b.txt", "untracked.txt"])
+    def test_uncommitted_change_invalidates_cache(self, task_worktree: Path, edited_file: str) -> None:
+        """Test an edit made after a cached pass is re-verified, not replayed."""
+        assert verify.run_verification_commands("task-a", "tasks.json")["success"]
+
+        (task_worktree / edited_file).write_text("nope\n")
+        result = verify.run_verification_commands("task-a", "tasks.json")
+
+        assert not result["success"]
+        assert "cached" not in result["results"][0]
@@ -59,52 +59,26 @@ def make_task(
 class TestGetImpliedResources:
     """Tests for get_implied_resources."""
 
-    def test_add_router_intent(self) -> None:
-        """Test extracting route resource from add_router intent."""
-        intent = {
-            "action": "add_router",
-            "intent": {"prefix": "/auth"},
-        }
-        resources = get_implied_resources(intent)
-
-        assert resources == ["route:/auth"]
-
-    def test_add_dependency_intent(self) -> None:
-        """Test extracting DI resource from add_dependency intent."""
-        intent = {
-            "action": "add_dependency",
-            "intent": {"function_name": "get_auth_service"},
-        }
-        resources = get_implied_resources(intent)
-
-        assert resources == ["di:get_auth_service"]
-
-    def test_add_config_intent(self) -> None:
-        """Test extracting config resource from add_config intent."""
-        intent = {
-            "action": "add_config",
-            "intent": {"key": "AUTH_SECRET"},
-        }
-        resources = get_implied_resources(intent)
-
-        assert resources == ["config:AUTH_SECRET"]
-
-    def test_add_middleware_intent(self) -> None:
-        """Test extracting middleware resource from add_middleware intent."""
-        intent = {
-            "action": "add_middleware",
-            "intent": {"middleware_class": "CORSMiddleware"},
-        }
-        resources = get_implied_resources(intent)
-
-        assert resources == ["middleware:CORSMiddleware"]
-
-    def test_unknown_action(self) -> None:
-        """Test unknown action returns empty list."""
-        intent = {"action": "unknown_action", "intent": {}}
-        resources = get_implied_resources(intent)
-
-        assert resources == []
+    @pytest.mark.parametrize(
+        "intent,expected",
+        [
+            ({"action": "add_router", "intent": {"prefix": "/auth"}}, ["route:/auth"]),
+            (
+                {"action": "add_dependency", "intent": {"function_name": "get_auth_service"}},
+                ["di:get_auth_service"],
+            ),
+            ({"action": "add_config", "intent": {"key": "AUTH_SECRET"}}, ["config:AUTH_SECRET"]),
+            (
+                {"action": "add_middleware", "intent": {"middleware_class": "CORSMiddleware"}},
+                ["middleware:CORSMiddleware"],
+            ),
+            ({"action": "unknown_action", "intent": {}}, []),
+        ],
+        ids=["add_router", "add_dependency", "add_config", "add_middleware", "unknown_action"],
+    )
+    def test_implied_resources(self, intent: dict, expected: list[str]) -> None:
+        """Test the resource each patch intent action implies."""
+        assert get_implied_resources(intent) == expected
 
 
 class TestDetectFileConflicts:
@@ -35,6 +35,43 @@ def make_task(
     )
 
 
+# Task corpora shared by several tests. Built once per module; tests only
+# read them, and tuples keep one test from appending to another's plan.
+@pytest.fixture(scope="module")
+def linear_chain_abc() -> tuple[TaskSpec, ...]:
+    """a <- b <- c."""
+    return (
+        make_task("a"),
+        make_task("b", depends_on=["a"]),
+        make_task("c", depends_on=["b"]),
+    )
+
+
+@pytest.fixture(scope="module")
+def diamond_abcd() -> tuple[TaskSpec, ...]:
+    """a fans out to b and c, which both feed d."""
+    #     a
+    #    / \
+    #   b   c
+    #    \ /
+    #     d
+    return (
+        make_task("a"),
+        make_task("b", depends_on=["a"]),
+        make_task("c", depends_on=["a"]),
+        make_task("d", depends_on=["b", "c"]),
+    )
+
+
+@pytest.fixture(scope="module")
+def two_node_cycle() -> tuple[TaskSpec, ...]:
+    """a and b depend on each other."""
+    return (
+        make_task("a", depends_on=["b"]),
+        make_task("b", depends_on=["a"]),
+    )
+
+
 class TestParseTaskDAG:
     """Tests for parse_task_dag."""
 
@@ -53,13 +90,9 @@ class TestParseTaskDAG:
         assert nodes["a"].depends_on == set()
         assert nodes["a"].dependents == set()
 
-    def test_linear_dependency(self) -> None:
+    def test_linear_dependency(self, linear_chain_abc: tuple[TaskSpec, ...]) -> None:
         """Test parsing linear dependency chain."""
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["b"]),
-        ]
+        tasks = linear_chain_abc
         nodes = parse_task_dag(tasks)
 
         assert nodes["a"].dependents == {"b"}
@@ -67,19 +100,9 @@ class TestParseTaskDAG:
         assert nodes["b"].dependents == {"c"}
         assert nodes["c"].depends_on == {"b"}
 
-    def test_diamond_dependency(self) -> None:
+    def test_diamond_dependency(self, diamond_abcd: tuple[TaskSpec, ...]) -> None:
         """Test parsing diamond dependency pattern."""
-        #     a
-        #    / \
-        #   b   c
-        #    \ /
-        #     d
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["a"]),
-            make_task("d", depends_on=["b", "c"]),
-        ]
+        tasks = diamond_abcd
         nodes = parse_task_dag(tasks)
 
         assert nodes["a"].dependents == {"b", "c"}
@@ -89,13 +112,9 @@ class TestParseTaskDAG:
 class TestDetectCycles:
     """Tests for detect_cycles."""
 
-    def test_no_cycles(self) -> None:
+    def test_no_cycles(self, linear_chain_abc: tuple[TaskSpec, ...]) -> None:
         """Test detecting no cycles in valid DAG."""
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["b"]),
-        ]
+        tasks = linear_chain_abc
         nodes = parse_task_dag(tasks)
         cycles = detect_cycles(nodes)
 
@@ -110,12 +129,9 @@ class TestDetectCycles:
         assert len(cycles) == 1
         assert "a" in cycles[0]
 
-    def test_two_node_cycle(self) -> None:
+    def test_two_node_cycle(self, two_node_cycle: tuple[TaskSpec, ...]) -> None:
         """Test detecting two-node cycle."""
-        tasks = [
-            make_task("a", depends_on=["b"]),
-            make_task("b", depends_on=["a"]),
-        ]
+        tasks = two_node_cycle
         nodes = parse_task_dag(tasks)
         cycles = detect_cycles(nodes)
 
@@ -143,12 +159,9 @@ class TestValidateDAG:
 
         assert "non-existent dependencies" in str(exc_info.value.message)
 
-    def test_cycle_detected(self) -> None:
+    def test_cycle_detected(self, two_node_cycle: tuple[TaskSpec, ...]) -> None:
         """Test detecting cycles."""
-        tasks = [
-            make_task("a", depends_on=["b"]),
-            make_task("b", depends_on=["a"]),
-        ]
+        tasks = two_node_cycle
 
         with pytest.raises(DAGValidationError) as exc_info:
             validate_dag(tasks)
@@ -183,13 +196,9 @@ class TestTopologicalSort:
         assert len(waves) == 1
         assert set(waves[0]) == {"a", "b", "c"}
 
-    def test_linear_chain(self) -> None:
+    def test_linear_chain(self, linear_chain_abc: tuple[TaskSpec, ...]) -> None:
         """Test sorting linear dependency chain."""
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["b"]),
-        ]
+        tasks = linear_chain_abc
         waves = topological_sort(tasks)
 
         assert len(waves) == 3
@@ -197,14 +206,9 @@ class TestTopologicalSort:
         assert waves[1] == ["b"]
         assert waves[2] == ["c"]
 
-    def test_diamond_pattern(self) -> None:
+    def test_diamond_pattern(self, diamond_abcd: tuple[TaskSpec, ...]) -> None:
         """Test sorting diamond dependency pattern."""
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["a"]),
-            make_task("d", depends_on=["b", "c"]),
-        ]
+        tasks = diamond_abcd
         waves = topological_sort(tasks)
 
         assert len(waves) == 3
@@ -248,13 +252,9 @@ class TestCriticalPath:
 
         assert path == ["a"]
 
-    def test_linear_chain(self) -> None:
+    def test_linear_chain(self, linear_chain_abc: tuple[TaskSpec, ...]) -> None:
         """Test critical path is the full chain."""
-        tasks = [
-            make_task("a"),
-            make_task("b", depends_on=["a"]),
-            make_task("c", depends_on=["b"]),
-        ]
+        tasks = linear_chain_abc
         path = compute_critical_path(tasks)
 
         assert path == ["a", "b", "c"]